@@ -6,7 +6,7 @@ To use:
 1. Copy this file to src/gulp_mlips/backends/my_backend.py
 2. Rename MyCustomBackend to your backend name
 3. Implement the load() method to initialize your calculator
-4. Register it in src/gulp_mlips/host.py
+4. Register it in src/gulp_mlips/backends/registry.py
 5. Test with: gulp-mlips-host --backend my_backend
 
 Example backends to reference:
@@ -24,6 +24,9 @@ class MyCustomBackend(CalculatorBackend):
     Replace this docstring with a description of your calculator.
     """
 
+    # List every attribute set in __init__ here
+    __slots__ = ("model_name", "device")
+
     def __init__(
         self,
         model: str = "default",
@@ -113,6 +116,8 @@ class SimpleASEBackend(CalculatorBackend):
     This shows how to use any ASE calculator with gulp-mlips.
     """
 
+    __slots__ = ("calculator_name",)
+
     def __init__(self, calculator_name: str = "EMT", **kwargs):
         """Initialize with ASE calculator name.
 
@@ -168,6 +173,8 @@ class SimpleASEBackend(CalculatorBackend):
 class FileBasedBackend(CalculatorBackend):
     """Example: Backend that loads a model from a file."""
 
+    __slots__ = ("model_path", "device")
+
     def __init__(
         self,
         model_path: str,
@@ -186,7 +193,15 @@ class FileBasedBackend(CalculatorBackend):
         self.device = device
 
     def load(self) -> None:
-        """Load calculator from file."""
+        """Load calculator from file.
+
+        The checkpoint is memory-mapped and loaded straight onto the target
+        device, while the model is built on the "meta" device (no storage).
+        Loading the state dict with assign=True then uses the mapped tensors
+        as the parameters, so peak host memory stays around one copy of the
+        checkpoint instead of two. Requires PyTorch >= 2.1 and a checkpoint
+        saved with torch.save's default (zipfile) format.
+        """
         from pathlib import Path
 
         # Validate file exists
@@ -194,12 +209,32 @@ class FileBasedBackend(CalculatorBackend):
         if not model_file.exists():
             raise FileNotFoundError(f"Model file not found: {self.model_path}")
 
+        try:
+            import torch
+        except ImportError as e:
+            raise ImportError(
+                "PyTorch not installed. Install with: pip install torch"
+            ) from e
+
         print(f"Loading model from: {self.model_path}")
 
         try:
-            # Your code to load the model
-            # self.calculator = load_my_calculator(self.model_path, device=self.device)
-            raise NotImplementedError("Implement model loading from file")
+            # Build the model without allocating parameter storage
+            # with torch.device("meta"):
+            #     model = MyModel(config)
+
+            # Memory-map the checkpoint instead of reading it into RAM
+            state_dict = torch.load(
+                self.model_path,
+                map_location=self.device,
+                weights_only=True,
+                mmap=True,
+            )
+
+            # Use the loaded tensors directly as the model parameters
+            # model.load_state_dict(state_dict, assign=True)
+            # self.calculator = MyASEAdapter(model)
+            raise NotImplementedError("Implement model construction from the state dict")
 
         except Exception as e:
             raise RuntimeError(f"Failed to load model: {e}") from e
@@ -221,9 +256,14 @@ To use your custom backend:
 
 1. Save your backend class in: src/gulp_mlips/backends/my_backend.py
 
-2. Add import in src/gulp_mlips/backends/__init__.py:
+2. Add it to the lazy imports in src/gulp_mlips/backends/__init__.py:
    ```python
-   from gulp_mlips.backends.my_backend import MyCustomBackend
+   _LAZY_IMPORTS = {
+       "CalculatorBackend": "gulp_mlips.backends.base",
+       "PETMADBackend": "gulp_mlips.backends.petmad",
+       "FairChemBackend": "gulp_mlips.backends.fairchem",
+       "MyCustomBackend": "gulp_mlips.backends.my_backend",  # Add here
+   }
 
    __all__ = [
        "CalculatorBackend",
@@ -233,17 +273,15 @@ To use your custom backend:
    ]
    ```
 
-3. Register in src/gulp_mlips/host.py:
+3. Register in src/gulp_mlips/backends/registry.py (the module is imported
+   only when the backend is selected):
    ```python
-   from gulp_mlips.backends.my_backend import MyCustomBackend
-
-   def load_backend(backend_name: str, **config) -> CalculatorBackend:
-       backend_map = {
-           'petmad': PETMADBackend,
-           'fairchem': FairChemBackend,
-           'mycustom': MyCustomBackend,  # Add here
-       }
+   BACKENDS = {
+       'petmad': ('gulp_mlips.backends.petmad', 'PETMADBackend'),
+       'fairchem': ('gulp_mlips.backends.fairchem', 'FairChemBackend'),
+       'mycustom': ('gulp_mlips.backends.my_backend', 'MyCustomBackend'),  # Add here
        ...
+   }
    ```
 
 4. Use it:
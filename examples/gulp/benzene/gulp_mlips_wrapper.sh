@@ -16,7 +16,13 @@
 # Set these environment variables before running GULP:
 #   HOST=127.0.0.1  (default: localhost)
 #   PORT=8193       (default: 8193)
+#   GULP_MLIPS_UDS=/tmp/gulp-mlips.sock
+#                   (optional: reach a host started with --uds over a Unix
+#                    domain socket; overrides HOST/PORT)
 #   DEBUG=1         (optional: enable debug output)
+#   GULP_MLIPS_CLIENT_SOCKET=/tmp/gulp-mlips-client.sock
+#                   (optional: forward to a resident client started with
+#                    gulp-mlips-client --serve-socket, skipping client start-up)
 #
 # Example:
 #   export PORT=8193
@@ -73,10 +79,15 @@ if [ "$DEBUG" = "1" ]; then
     echo "Calling gulp-mlips-client..." >&2
 fi
 
-gulp-mlips-client "$INPUT_FILE" "$OUTPUT_FILE" \
-    --host "$HOST" \
-    --port "$PORT" \
-    --timeout 300
+if [ -n "$GULP_MLIPS_CLIENT_SOCKET" ]; then
+    gulp-mlips-external "$INPUT_FILE" "$OUTPUT_FILE" \
+        --socket "$GULP_MLIPS_CLIENT_SOCKET"
+else
+    gulp-mlips-client "$INPUT_FILE" "$OUTPUT_FILE" \
+        --host "$HOST" \
+        --port "$PORT" \
+        --timeout 300
+fi
 
 # Verify output file was created
 if [ ! -f "$OUTPUT_FILE" ]; then
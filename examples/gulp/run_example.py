@@ -14,20 +14,96 @@ Usage:
 """
 
 import argparse
+import errno
 import os
+import re
+import select
+import selectors
 import signal
+import socket
 import subprocess
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# Read size for streaming GULP output
+STREAM_CHUNK_SIZE = 65536
+
+# Optimization progress lines, e.g. "Cycle:      1 Energy:    -172.585487 ..."
+_GULP_CYCLE_RE = re.compile(rb"Cycle:\s+(\d+)\s+Energy:\s+(\S+)")
+
+# Longest partial line kept between chunks when scanning for progress
+_PROGRESS_TAIL_SIZE = 256
+
+
+def _probe_ready(
+    host: str, port: int, timeout: float, pidfd: Optional[int] = None
+) -> bool:
+    """Check whether a TCP connection to host:port can be established.
+
+    Uses a non-blocking connect and waits on the socket with a selector, so
+    the call returns as soon as the connection succeeds or is refused. If a
+    process file descriptor is given, the wait also ends when that process
+    exits.
+
+    Args:
+        host: Server address
+        port: Server port
+        timeout: Maximum time to block waiting for the connection (seconds)
+        pidfd: Optional pidfd of the server process (Linux)
+
+    Returns:
+        True if the port is accepting connections
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setblocking(False)
+    try:
+        err = sock.connect_ex((host, port))
+        if err in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+            # Connection in progress: wait for it to complete or fail
+            with selectors.DefaultSelector() as selector:
+                selector.register(sock, selectors.EVENT_WRITE, "ready")
+                if pidfd is not None:
+                    selector.register(pidfd, selectors.EVENT_READ, "dead")
+                events = selector.select(timeout)
+            if not events or any(key.data == "dead" for key, _ in events):
+                return False
+            err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        return err == 0
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+def _open_pidfd(process: Optional[subprocess.Popen]) -> Optional[int]:
+    """Open a pidfd for process, which becomes readable when it exits.
+
+    Returns:
+        File descriptor, or None where pidfds are unsupported (non-Linux,
+        Linux < 5.3)
+    """
+    if process is None or not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        return os.pidfd_open(process.pid)
+    except OSError:
+        return None
 
 
 class ServerManager:
     """Manages gulp-mlips-host server lifecycle with exponential backoff."""
 
+    # Backends with one-off first-call costs worth warming up. The GULP
+    # backend runs a separate GULP process per call, and the H2 warmup
+    # structure may not suit its keywords/library, so it is skipped.
+    WARMUP_BACKENDS = ("petmad", "fairchem")
+
     def __init__(
         self,
         backend: str,
@@ -37,6 +113,7 @@ class ServerManager:
         task: Optional[str] = None,
         keywords: Optional[str] = None,
         max_wait: int = 120,
+        warmup: bool = True,
     ):
         self.backend = backend
         self.port = port
@@ -45,8 +122,17 @@ class ServerManager:
         self.task = task
         self.keywords = keywords
         self.max_wait = max_wait
+        self.warmup = warmup
         self.process: Optional[subprocess.Popen] = None
         self.log_file = Path("host.log")
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._warmup_future: Optional[Future] = None
+
+        # Reuse one connection for repeated health checks
+        self._probe_session = requests.Session()
+        self._probe_session.mount(
+            "http://", HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        )
 
     def start(self) -> bool:
         """Start the server and wait for it to become healthy."""
@@ -84,7 +170,7 @@ class ServerManager:
                 cmd,
                 stdout=log,
                 stderr=subprocess.STDOUT,
-                preexec_fn=os.setsid if sys.platform != "win32" else None,
+                start_new_session=(sys.platform != "win32"),
             )
 
         # Wait for health check with exponential backoff
@@ -93,15 +179,66 @@ class ServerManager:
 
         print("Server is ready!")
         print()
+
+        # Warm up the backend in the background while GULP starts
+        if self.warmup and self.backend in self.WARMUP_BACKENDS:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+            self._warmup_future = self._executor.submit(self._warmup)
+
         return True
 
+    def _warmup(self) -> bool:
+        """Send a small H2 calculation to trigger lazy backend initialization.
+
+        Runs in a background thread so that one-off costs of the first
+        calculation (e.g. kernel compilation) overlap with GULP's startup
+        instead of delaying its first force call.
+        """
+        url = f"http://127.0.0.1:{self.port}/calculate"
+        request_data = {
+            "structure": {
+                "symbols": ["H", "H"],
+                "positions": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.74]],
+            },
+            "properties": ["energy", "forces"],
+        }
+        try:
+            response = requests.post(url, json=request_data, timeout=self.max_wait)
+        except requests.RequestException as e:
+            print(f"Warning: warmup calculation failed: {e}")
+            return False
+
+        if not response.ok:
+            print(f"Warning: warmup calculation failed (HTTP {response.status_code})")
+        return response.ok
+
     def _wait_for_health(self) -> bool:
-        """Wait for server health endpoint with exponential backoff."""
-        url = f"http://127.0.0.1:{self.port}/health"
-        elapsed = 0
+        """Wait for server health endpoint, probing the listening socket.
+
+        The wait blocks on a non-blocking TCP connect rather than sleeping, so
+        readiness is detected as soon as the server starts listening. The
+        exponential backoff only caps how long each connect attempt may block.
+        On Linux the waits also watch a pidfd of the server process, so a
+        crash during startup is noticed immediately.
+        """
+        pidfd = _open_pidfd(self.process)
+        try:
+            return self._wait_for_health_loop(pidfd)
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
+
+    def _wait_for_health_loop(self, pidfd: Optional[int]) -> bool:
+        """Probe loop for _wait_for_health."""
+        host = "127.0.0.1"
+        url = f"http://{host}:{self.port}/health"
+        start = time.monotonic()
+        elapsed = 0.0
         attempt = 0
         backoff = 0.5  # Start with 0.5 seconds
         max_backoff = 8  # Cap at 8 seconds
+        retry_interval = 0.05  # Delay between refused connects
+        next_report = 0.0
 
         print(f"Waiting for server at {url}...")
 
@@ -117,37 +254,38 @@ class ServerManager:
                 self._show_log_tail()
                 return False
 
-            # Try health check
-            try:
-                response = requests.get(url, timeout=2)
-                if response.ok:
-                    print(
-                        f"Server is healthy! (took {elapsed:.1f}s, {attempt} attempts)"
-                    )
-                    return True
-            except (requests.ConnectionError, requests.Timeout):
-                pass
-
-            # Show progress
-            if attempt == 1:
-                print(f"  Attempt {attempt}: waiting {backoff:.1f}s...")
-            elif attempt <= 5:
-                print(
-                    f"  Attempt {attempt}: waiting {backoff:.1f}s (elapsed: {elapsed:.1f}s)"
-                )
+            # Only hit /health once the port accepts connections
+            timeout = min(backoff, self.max_wait - elapsed)
+            if _probe_ready(host, self.port, timeout, pidfd):
+                try:
+                    response = self._probe_session.get(url, timeout=2)
+                    if response.ok:
+                        elapsed = time.monotonic() - start
+                        print(
+                            f"Server is healthy! (took {elapsed:.1f}s, {attempt} attempts)"
+                        )
+                        return True
+                except (requests.ConnectionError, requests.Timeout):
+                    pass
+
+            # A refused connect returns immediately; avoid a busy loop, but
+            # wake early if the server exits
+            if pidfd is not None:
+                select.select([pidfd], [], [], retry_interval)
             else:
-                # After 5 attempts, only show every few attempts to reduce noise
-                if attempt % 3 == 0:
-                    print(
-                        f"  Attempt {attempt}: still waiting (elapsed: {elapsed:.1f}s / {self.max_wait}s)"
-                    )
+                time.sleep(retry_interval)
 
-            # Sleep and update elapsed time
-            time.sleep(backoff)
-            elapsed += backoff
+            elapsed = time.monotonic() - start
 
-            # Increase backoff exponentially, capped at max_backoff
-            backoff = min(backoff * 1.5, max_backoff)
+            # Show progress roughly once per backoff interval
+            if elapsed >= next_report:
+                print(
+                    f"  Attempt {attempt}: still waiting (elapsed: {elapsed:.1f}s / {self.max_wait}s)"
+                )
+                next_report = elapsed + backoff
+
+                # Increase backoff exponentially, capped at max_backoff
+                backoff = min(backoff * 1.5, max_backoff)
 
         print()
         print(f"ERROR: Server failed to become healthy after {self.max_wait}s")
@@ -155,17 +293,38 @@ class ServerManager:
         return False
 
     def _show_log_tail(self, lines: int = 20):
-        """Show the last N lines of the server log."""
+        """Show the last N lines of the server log.
+
+        Reads backwards from the end of the file in growing blocks, so the
+        cost does not depend on the size of the log.
+        """
         print(f"Check {self.log_file} for details:", file=sys.stderr)
-        if self.log_file.exists():
-            with open(self.log_file) as f:
-                all_lines = f.readlines()
-                tail_lines = all_lines[-lines:]
-                for line in tail_lines:
-                    print(line, end="", file=sys.stderr)
+        if not self.log_file.exists():
+            return
+
+        max_block = 1 << 20  # Give up looking for more lines after 1 MB
+        with open(self.log_file, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            block = min(size, max(4096, lines * 200))
+            while True:
+                f.seek(size - block)
+                data = f.read(block)
+                # One extra newline, as the first line may be partial
+                if block == size or block >= max_block or data.count(b"\n") > lines:
+                    break
+                block = min(size, block * 2, max_block)
+
+        tail = data.splitlines(keepends=True)[-lines:]
+        sys.stderr.flush()
+        sys.stderr.buffer.write(b"".join(tail))
+        sys.stderr.buffer.flush()
 
     def stop(self):
         """Stop the server."""
+        self._probe_session.close()
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
         if self.process:
             print()
             print("Cleaning up...")
@@ -197,8 +356,49 @@ class ServerManager:
             print("Done!")
 
 
-def run_gulp(input_file: Path, output_file: Path, port: int) -> bool:
-    """Run GULP with the specified input file, streaming output in real-time."""
+def _find_missing_commands(commands: list[str]) -> list[str]:
+    """Return the commands that are not found as executables on PATH.
+
+    Walks PATH once, listing each directory a single time, rather than
+    searching PATH separately for every command.
+    """
+    if sys.platform == "win32":
+        extensions = [""] + os.environ.get("PATHEXT", "").lower().split(os.pathsep)
+    else:
+        extensions = [""]
+
+    missing = list(commands)
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        if not missing:
+            break
+        try:
+            entries = set(os.listdir(directory or "."))
+        except OSError:
+            continue
+        if sys.platform == "win32":
+            entries = {entry.lower() for entry in entries}
+
+        for cmd in list(missing):
+            for ext in extensions:
+                name = cmd + ext
+                lookup = name.lower() if sys.platform == "win32" else name
+                if lookup in entries and os.access(
+                    os.path.join(directory or ".", name), os.X_OK
+                ):
+                    missing.remove(cmd)
+                    break
+
+    return missing
+
+
+def run_gulp(
+    input_file: Path, output_file: Path, port: int, progress: bool = False
+) -> bool:
+    """Run GULP with the specified input file, streaming output in real-time.
+
+    With progress=True, only a one-line summary per optimization cycle is
+    shown on the console; the full output is still written to output_file.
+    """
     print("Running GULP optimization...")
     print(f"  Input:  {input_file}")
     print(f"  Output: {output_file}")
@@ -211,22 +411,39 @@ def run_gulp(input_file: Path, output_file: Path, port: int) -> bool:
     env["PORT"] = str(port)
 
     # Run GULP with streaming output
-    with open(input_file) as stdin, open(output_file, "w") as outfile:
+    with open(input_file, "rb") as stdin, open(output_file, "wb", buffering=0) as outfile:
         process = subprocess.Popen(
             ["gulp"],
             stdin=stdin,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             env=env,
-            text=True,
-            bufsize=1,  # Line buffered
+            bufsize=0,  # Unbuffered binary pipe: read() returns what is available
         )
 
-        # Stream output to both stdout and file
-        for line in process.stdout:
-            print(line, end="")  # Print to console
-            outfile.write(line)  # Write to file
-            outfile.flush()  # Ensure it's written immediately
+        # Stream raw output chunks to both stdout and file
+        console = sys.stdout.buffer
+        sys.stdout.flush()
+        tail = b""
+        while chunk := process.stdout.read(STREAM_CHUNK_SIZE):
+            outfile.write(chunk)
+            if progress:
+                # Scan complete lines only; carry the partial last line over
+                data = tail + chunk
+                end = data.rfind(b"\n") + 1
+                for match in _GULP_CYCLE_RE.finditer(data, 0, end):
+                    cycle, energy = match.groups()
+                    console.write(b"  Cycle %s: energy %s\n" % (cycle, energy))
+                tail = data[end:][-_PROGRESS_TAIL_SIZE:]
+            else:
+                console.write(chunk)
+
+            # Flush once the pipe is drained rather than after every chunk,
+            # so bursts of output cost a single flush
+            if sys.platform == "win32" or not select.select([process.stdout], [], [], 0)[0]:
+                console.flush()
+
+        console.flush()
 
         # Wait for process to complete
         returncode = process.wait()
@@ -294,6 +511,16 @@ Examples:
         default=120,
         help="Max wait time for server startup (default: 120s)",
     )
+    parser.add_argument(
+        "--no-warmup",
+        action="store_true",
+        help="Skip the background warmup calculation after server startup",
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="Show one line per optimization cycle instead of the full GULP output",
+    )
 
     args = parser.parse_args()
 
@@ -312,14 +539,15 @@ Examples:
             args.max_wait = 180
 
     # Check prerequisites
-    for cmd in ["gulp", "gulp-mlips-host", "gulp-mlips-client"]:
-        if not subprocess.run(["which", cmd], capture_output=True).returncode == 0:
+    missing = _find_missing_commands(["gulp", "gulp-mlips-host", "gulp-mlips-client"])
+    if missing:
+        for cmd in missing:
             print(f"ERROR: {cmd} not found in PATH", file=sys.stderr)
-            if cmd == "gulp":
-                print("Please install GULP or add it to your PATH", file=sys.stderr)
-            else:
-                print("Please install gulp-mlips: pip install -e .", file=sys.stderr)
-            return 1
+        if "gulp" in missing:
+            print("Please install GULP or add it to your PATH", file=sys.stderr)
+        if any(cmd != "gulp" for cmd in missing):
+            print("Please install gulp-mlips: pip install -e .", file=sys.stderr)
+        return 1
 
     # Create server manager
     server = ServerManager(
@@ -330,6 +558,7 @@ Examples:
         task=args.task,
         keywords=args.keywords,
         max_wait=args.max_wait,
+        warmup=not args.no_warmup,
     )
 
     # Ensure cleanup happens on exit
@@ -354,7 +583,7 @@ Examples:
         return 1
 
     # Run GULP
-    success = run_gulp(args.input, args.output, args.port)
+    success = run_gulp(args.input, args.output, args.port, progress=args.progress)
 
     # Show output files
     if success:
@@ -13,10 +13,17 @@ Usage:
 
 __version__ = "0.1.0"
 
-from gulp_mlips.formats.readers import read_xyz, read_structure
-from gulp_mlips.formats.drv import write_drv
-from gulp_mlips.backends.base import CalculatorBackend
-from gulp_mlips.backends.petmad import PETMADBackend
+import importlib
+
+# Public names are imported on first access (PEP 562) so that importing the
+# package, e.g. from gulp-mlips-client, does not pull in every backend.
+_LAZY_IMPORTS = {
+    "read_xyz": "gulp_mlips.formats.readers",
+    "read_structure": "gulp_mlips.formats.readers",
+    "write_drv": "gulp_mlips.formats.drv",
+    "CalculatorBackend": "gulp_mlips.backends.base",
+    "PETMADBackend": "gulp_mlips.backends.petmad",
+}
 
 __all__ = [
     "read_xyz",
@@ -25,3 +32,15 @@ __all__ = [
     "CalculatorBackend",
     "PETMADBackend",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -1,11 +1,29 @@
 """Calculator backends for gulp-mlips."""
 
-from gulp_mlips.backends.base import CalculatorBackend
-from gulp_mlips.backends.petmad import PETMADBackend
-from gulp_mlips.backends.fairchem import FairChemBackend
+import importlib
+
+# Backend classes are imported on first access (PEP 562), so optional heavy
+# dependencies are only loaded for the backend actually used.
+_LAZY_IMPORTS = {
+    "CalculatorBackend": "gulp_mlips.backends.base",
+    "PETMADBackend": "gulp_mlips.backends.petmad",
+    "FairChemBackend": "gulp_mlips.backends.fairchem",
+}
 
 __all__ = [
     "CalculatorBackend",
     "PETMADBackend",
     "FairChemBackend",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -3,18 +3,38 @@
 All calculator backends should inherit from CalculatorBackend.
 """
 
+import os
+import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Iterable, Optional, TypeVar
+import numpy as np
 from ase import Atoms
-from ase.calculators.calculator import Calculator
+from ase.calculators.calculator import (
+    Calculator,
+    PropertyNotImplementedError,
+    all_changes,
+)
+from ase.stress import full_3x3_to_voigt_6_stress
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
 
 
 class CalculatorBackend(ABC):
     """Abstract base class for calculator backends.
 
     Each backend (e.g., PET-MAD, MACE, etc.) should implement this interface.
+
+    A backend holds a single calculator for the lifetime of the process.
+    Calculations are serialized with a lock, since ASE calculators keep
+    per-call state (e.g. calculator.results) and are not thread-safe.
     """
 
+    __slots__ = ("config", "calculator", "_implemented", "_lock")
+
     def __init__(self, **kwargs):
         """Initialize the calculator backend.
 
@@ -23,6 +43,8 @@ class CalculatorBackend(ABC):
         """
         self.config = kwargs
         self.calculator: Optional[Calculator] = None
+        self._implemented: Optional[frozenset[str]] = None
+        self._lock = threading.Lock()
 
     @abstractmethod
     def load(self) -> None:
@@ -61,6 +83,20 @@ class CalculatorBackend(ABC):
         """
         return self.calculator is not None
 
+    def get_implemented_properties(self) -> frozenset[str]:
+        """Get the properties the loaded calculator can compute.
+
+        Read once from the calculator's implemented_properties; calculators
+        that do not declare any are assumed to provide energy and forces.
+
+        Returns:
+            Set of property names (e.g. {"energy", "forces", "stress"})
+        """
+        if self._implemented is None:
+            implemented = getattr(self.calculator, "implemented_properties", None)
+            self._implemented = frozenset(implemented or ("energy", "forces"))
+        return self._implemented
+
     def calculate(
         self,
         atoms: Atoms,
@@ -78,6 +114,7 @@ class CalculatorBackend(ABC):
             - "energy": float (in eV)
             - "forces": np.ndarray (Nx3, in eV/Ang)
             - "stress": np.ndarray (6-component Voigt, in eV/Ang^3) [optional]
+              None for non-periodic systems or calculators without stress
 
         Raises:
             RuntimeError: If calculator is not loaded or calculation fails
@@ -88,27 +125,77 @@ class CalculatorBackend(ABC):
         if self.calculator is None:
             raise RuntimeError("Calculator is None")
 
-        # Attach calculator to atoms
-        atoms.calc = self.calculator
+        # Attach calculator to atoms (only if not already attached)
+        if atoms.calc is not self.calculator:
+            atoms.calc = self.calculator
+
+        # Only calculate stress for periodic systems, and only ask for it
+        # if the calculator implements it
+        is_periodic = bool(atoms.pbc.any())
+        compute_stress = (
+            "stress" in properties
+            and is_periodic
+            and "stress" in self.get_implemented_properties()
+        )
+        requested = [p for p in properties if p != "stress"]
+        if compute_stress:
+            requested.append("stress")
 
-        # Calculate requested properties
-        results = {}
+        # Evaluate all requested properties in a single calculator call,
+        # rather than one atoms.get_*() call (and potentially one model
+        # forward pass) per property. The calculator's cached results are
+        # kept when the structure is unchanged and already has them.
+        with self._lock:
+            if self.calculator.calculation_required(atoms, requested):
+                self.calculator.reset()
+                self.calculator.calculate(
+                    atoms, properties=requested, system_changes=all_changes
+                )
+            calc_results = self.calculator.results
 
-        if "energy" in properties:
-            results["energy"] = atoms.get_potential_energy()
+        missing = [p for p in requested if p not in calc_results]
+        if missing:
+            raise PropertyNotImplementedError(
+                f"{self.get_name()} did not calculate: {', '.join(missing)}"
+            )
 
-        if "forces" in properties:
-            results["forces"] = atoms.get_forces()
+        # Collect requested properties
+        results = {p: calc_results[p] for p in requested}
 
-        if "stress" in properties:
-            # Only calculate stress for periodic systems
-            if any(atoms.get_pbc()):
-                results["stress"] = atoms.get_stress(voigt=True)
-            else:
-                results["stress"] = None
+        if compute_stress:
+            stress = results["stress"]
+            if stress.shape == (3, 3):
+                stress = full_3x3_to_voigt_6_stress(stress)
+            results["stress"] = stress
+        elif "stress" in properties:
+            results["stress"] = None
 
         return results
 
+    def calculate_batch(
+        self,
+        atoms_list: list[Atoms],
+        properties: list[str] = ["energy", "forces"],
+    ) -> list[Dict[str, Any]]:
+        """Calculate properties for several structures.
+
+        The default implementation calls calculate() for each structure.
+        Backends whose models support batched inference can override this
+        to evaluate all structures in a single forward pass.
+
+        Args:
+            atoms_list: List of ASE Atoms objects
+            properties: List of properties to calculate for every structure
+
+        Returns:
+            List of result dictionaries (as returned by calculate()),
+            in the same order as atoms_list
+
+        Raises:
+            RuntimeError: If calculator is not loaded or calculation fails
+        """
+        return [self.calculate(atoms, properties=properties) for atoms in atoms_list]
+
     def cleanup(self) -> None:
         """Clean up resources.
 
@@ -118,3 +205,143 @@ class CalculatorBackend(ABC):
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name={self.get_name()}, loaded={self.is_loaded()})"
+
+
+def pack_binary_results(results: Dict[str, Any], dtype: str = "<f8") -> Dict[str, Any]:
+    """Replace the forces in a results dictionary with a raw byte buffer.
+
+    Args:
+        results: Results dictionary from CalculatorBackend.calculate()
+        dtype: NumPy dtype string for the packed forces
+
+    Returns:
+        Copy of results with "forces" replaced by:
+        - "forces_bytes": bytes (Nx3 forces in eV/Ang, row-major)
+        - "shape": tuple, shape of the packed forces
+        - "dtype": str, dtype of the packed forces (e.g. "<f8")
+    """
+    packed = dict(results)
+    forces = np.ascontiguousarray(packed.pop("forces"), dtype=dtype)
+    packed["forces_bytes"] = forces.tobytes()
+    packed["shape"] = forces.shape
+    packed["dtype"] = forces.dtype.str
+    return packed
+
+
+def _read_range(item: tuple) -> int:
+    """Read one byte range of a file, discarding the data."""
+    path, offset, length = item
+    buffer = bytearray(length)
+    with open(path, "rb", buffering=0) as f:
+        f.seek(offset)
+        return f.readinto(buffer) or 0
+
+
+def prefetch_files(paths: Iterable[str], block_size: int = 16 * 1024 * 1024) -> int:
+    """Read files into the OS page cache using parallel reads.
+
+    Model checkpoints are read sequentially by torch.load; warming the page
+    cache first with concurrent reads makes better use of disk bandwidth,
+    so the load itself is served from memory.
+
+    Args:
+        paths: Files to read
+        block_size: Size of each concurrently read block in bytes
+
+    Returns:
+        Total number of bytes read
+    """
+    ranges = []
+    for path in paths:
+        size = os.path.getsize(path)
+        ranges.extend(
+            (path, offset, min(block_size, size - offset))
+            for offset in range(0, size, block_size)
+        )
+
+    if not ranges:
+        return 0
+
+    workers = min(len(ranges), os.cpu_count() or 1, 16)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return sum(pool.map(_read_range, ranges))
+
+
+def set_matmul_precision(device: str, precision: Optional[str]) -> None:
+    """Set the PyTorch float32 matmul precision for CUDA devices.
+
+    "high" and "medium" allow TF32 tensor cores on Ampere and newer GPUs,
+    trading a little precision for much faster matmuls; "highest" keeps
+    full float32. Has no effect on CPU or when precision is None.
+
+    Args:
+        device: Device the model runs on ("cpu", "cuda", "cuda:1", etc.)
+        precision: "highest", "high", "medium" or None
+    """
+    if precision is None or "cuda" not in str(device):
+        return
+
+    import torch
+
+    torch.set_float32_matmul_precision(precision)
+    allow_tf32 = precision != "highest"
+    torch.backends.cuda.matmul.allow_tf32 = allow_tf32
+    torch.backends.cudnn.allow_tf32 = allow_tf32
+    logger.info(f"  Float32 matmul precision: {precision} (TF32 {'on' if allow_tf32 else 'off'})")
+
+
+def construct_on_device(device: str, factory: Callable[[], T]) -> T:
+    """Build a model with new tensors allocated directly on a CUDA device.
+
+    Runs factory() inside a torch.device context, so parameters created
+    during construction skip the CPU copy and later transfer. If that
+    fails with a device error (some loaders assume CPU tensors),
+    construction is retried the usual way; any other error is raised.
+    On CPU, or without CUDA, factory() is simply called.
+
+    Args:
+        device: Device the model runs on ("cpu", "cuda", "cuda:1", etc.)
+        factory: Zero-argument callable constructing the model/calculator
+
+    Returns:
+        Result of factory()
+
+    Raises:
+        Exception: Whatever factory() raises, other than device errors
+            inside the device context
+    """
+    if "cuda" not in str(device):
+        return factory()
+
+    import torch
+
+    if not torch.cuda.is_available():
+        return factory()
+
+    try:
+        with torch.device(device):
+            return factory()
+    except RuntimeError as e:
+        message = str(e).lower()
+        if "device" not in message and "cuda" not in message:
+            raise
+        logger.warning(f"Construction directly on {device} failed ({e}), retrying via CPU")
+        return factory()
+
+
+def init_device(device: str) -> None:
+    """Create the CUDA context for a device ahead of first use.
+
+    CUDA context creation takes a second or more; calling this from a
+    worker thread lets it overlap with checkpoint download and reads.
+    Has no effect on CPU.
+
+    Args:
+        device: Device the model runs on ("cpu", "cuda", "cuda:1", etc.)
+    """
+    if "cuda" not in str(device):
+        return
+
+    import torch
+
+    torch.empty(1, device=device)
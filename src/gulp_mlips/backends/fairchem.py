@@ -10,8 +10,16 @@ Requirements:
 """
 
 import logging
-from typing import Optional
-from .base import CalculatorBackend
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+from ase import Atoms
+from ase.stress import full_3x3_to_voigt_6_stress
+from .base import (
+    CalculatorBackend,
+    construct_on_device,
+    init_device,
+    prefetch_files,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +30,8 @@ class FairChemBackend(CalculatorBackend):
     Uses the fairchem-core package with UMA models via ASE FAIRChemCalculator interface.
     """
 
+    __slots__ = ("model_name", "task_name", "device", "inference_settings")
+
     AVAILABLE_MODELS = {
         "uma-s-1p1": {
             "description": "UMA Small v1.1 (recommended small model)",
@@ -42,11 +52,14 @@ class FairChemBackend(CalculatorBackend):
         "omc": "Molecular crystals",
     }
 
+    INFERENCE_SETTINGS = ("default", "turbo", "batch", "traineval")
+
     def __init__(
         self,
         model: str = "uma-s-1p1",
         task: str = "omat",
         device: str = "cpu",
+        inference_settings: str = "default",
         **kwargs
     ):
         """Initialize FairChem UMA backend.
@@ -60,6 +73,14 @@ class FairChemBackend(CalculatorBackend):
                   - 'odac': MOFs
                   - 'omc': molecular crystals
             device: Device to use ("cpu", "cuda", etc.)
+            inference_settings: Name of a fairchem inference preset. What
+                  each preset enables (MoLE merging, torch.compile) depends
+                  on the fairchem-core version; the names are checked against
+                  the installed version on load():
+                  - 'default': fairchem's standard inference settings
+                  - 'turbo': 'default' with TF32 matmuls (newer versions)
+                  - 'batch': for batches of mixed compositions (newer versions)
+                  - 'traineval': the settings used for training/evaluation
             **kwargs: Additional arguments
 
         Note:
@@ -67,10 +88,17 @@ class FairChemBackend(CalculatorBackend):
                 huggingface-cli login
             and request access at: https://huggingface.co/facebook/UMA
         """
-        super().__init__(model=model, task=task, device=device, **kwargs)
+        super().__init__(
+            model=model,
+            task=task,
+            device=device,
+            inference_settings=inference_settings,
+            **kwargs
+        )
         self.model_name = model
         self.task_name = task
         self.device = device
+        self.inference_settings = inference_settings
 
         # Validate model choice
         if model not in self.AVAILABLE_MODELS:
@@ -89,11 +117,20 @@ class FairChemBackend(CalculatorBackend):
                 f"Use 'omat' for bulk materials, 'oc20' for catalysis, 'omol' for molecules."
             )
 
+        # Validate inference settings
+        if inference_settings not in self.INFERENCE_SETTINGS:
+            available = ", ".join(self.INFERENCE_SETTINGS)
+            raise ValueError(
+                f"Unknown inference settings: {inference_settings}. "
+                f"Available: {available}"
+            )
+
     def load(self) -> None:
         """Load FairChem UMA calculator.
 
         Raises:
             ImportError: If fairchem-core is not installed
+            ValueError: If the installed fairchem-core lacks the inference preset
             RuntimeError: If loading fails (e.g., HuggingFace auth issues)
         """
         try:
@@ -105,6 +142,8 @@ class FairChemBackend(CalculatorBackend):
                 "Also requires HuggingFace authentication: huggingface-cli login"
             ) from e
 
+        self._check_inference_settings()
+
         try:
             model_info = self.AVAILABLE_MODELS[self.model_name]
             task_desc = self.AVAILABLE_TASKS[self.task_name]
@@ -114,12 +153,28 @@ class FairChemBackend(CalculatorBackend):
             logger.info(f"  Size: {model_info['size']}")
             logger.info(f"  Task: {self.task_name} ({task_desc})")
             logger.info(f"  Device: {self.device}")
+            logger.info(f"  Inference settings: {self.inference_settings}")
             logger.info("Note: First-time download may take a few minutes...")
 
+            # Resolve (downloading if needed) and pre-read the checkpoint, so
+            # get_predict_unit loads it from the page cache. CUDA context
+            # creation runs alongside in a worker thread.
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                device_ready = pool.submit(init_device, self.device)
+                checkpoint_path = pretrained_mlip.pretrained_checkpoint_path_from_name(
+                    self.model_name
+                )
+                prefetch_files([checkpoint_path])
+                device_ready.result()
+
             # Load the predictor unit
-            predictor = pretrained_mlip.get_predict_unit(
-                self.model_name,
-                device=self.device
+            predictor = construct_on_device(
+                self.device,
+                lambda: pretrained_mlip.get_predict_unit(
+                    self.model_name,
+                    inference_settings=self.inference_settings,
+                    device=self.device
+                ),
             )
 
             # Create calculator with task-specific settings
@@ -141,6 +196,92 @@ class FairChemBackend(CalculatorBackend):
             else:
                 raise RuntimeError(f"Failed to load FairChem UMA calculator: {e}") from e
 
+    def _check_inference_settings(self) -> None:
+        """Check the inference preset against the installed fairchem-core.
+
+        Raises:
+            ValueError: If fairchem-core does not define the preset
+        """
+        try:
+            from fairchem.core.units.mlip_unit.api.inference import (
+                NAME_TO_INFERENCE_SETTING,
+            )
+        except ImportError:
+            # Older or reorganised fairchem; get_predict_unit checks the name
+            logger.debug("Cannot list fairchem inference presets to check against")
+            return
+
+        if self.inference_settings not in NAME_TO_INFERENCE_SETTING:
+            available = ", ".join(NAME_TO_INFERENCE_SETTING)
+            raise ValueError(
+                f"Inference settings '{self.inference_settings}' are not available "
+                f"in the installed fairchem-core. Available: {available}"
+            )
+
+    def calculate_batch(
+        self,
+        atoms_list: list[Atoms],
+        properties: list[str] = ["energy", "forces"],
+    ) -> list[Dict[str, Any]]:
+        """Calculate properties for several structures in one forward pass.
+
+        Converts each structure with the calculator's AtomicData converter,
+        batches them with atomicdata_list_to_batch and runs the predictor
+        once. Falls back to one calculation per structure if the calculator
+        does not expose the converter, predictor and its atoms validation.
+
+        Args:
+            atoms_list: List of ASE Atoms objects
+            properties: List of properties to calculate for every structure
+
+        Returns:
+            List of result dictionaries, in the same order as atoms_list
+        """
+        if not self.is_loaded():
+            raise RuntimeError("Calculator not loaded. Call load() first.")
+
+        calc = self.calculator
+        if not (hasattr(calc, "a2g")
+                and hasattr(calc, "predictor")
+                and hasattr(calc.predictor, "validate_atoms_data")):
+            return super().calculate_batch(atoms_list, properties)
+
+        from fairchem.core.datasets.atomic_data import atomicdata_list_to_batch
+
+        for atoms in atoms_list:
+            calc.predictor.validate_atoms_data(atoms, calc.task_name)
+
+        batch = atomicdata_list_to_batch([calc.a2g(atoms) for atoms in atoms_list])
+        with self._lock:
+            pred = calc.predictor.predict(batch)
+
+        # System-level outputs have one row per structure; per-atom outputs
+        # are concatenated in input order
+        energies = pred["energy"].detach().cpu().numpy()
+        forces = pred["forces"].detach().cpu().numpy()
+        stresses = None
+        if "stress" in pred:
+            stresses = pred["stress"].detach().cpu().numpy().reshape(-1, 3, 3)
+
+        results = []
+        offset = 0
+        for i, atoms in enumerate(atoms_list):
+            natoms = len(atoms)
+            result = {}
+            if "energy" in properties:
+                result["energy"] = float(energies[i])
+            if "forces" in properties:
+                result["forces"] = forces[offset:offset + natoms]
+            if "stress" in properties:
+                if stresses is not None and atoms.pbc.any():
+                    result["stress"] = full_3x3_to_voigt_6_stress(stresses[i])
+                else:
+                    result["stress"] = None
+            offset += natoms
+            results.append(result)
+
+        return results
+
     def get_name(self) -> str:
         """Get backend name.
 
@@ -17,6 +17,10 @@ from gulp_mlips.backends.base import CalculatorBackend
 
 logger = logging.getLogger(__name__)
 
+# Shared stress result for failed/unavailable stress (read-only, never copied)
+_ZERO_STRESS = np.zeros(6)
+_ZERO_STRESS.setflags(write=False)
+
 
 class GFNFFBackend(CalculatorBackend):
     """GFN-FF calculator backend using xTB.
@@ -37,6 +41,16 @@ class GFNFFBackend(CalculatorBackend):
         solvent: Implicit solvent model (e.g., 'water', 'acetonitrile')
     """
 
+    __slots__ = (
+        "method",
+        "accuracy",
+        "electronic_temperature",
+        "max_iterations",
+        "solvent",
+        "_calculator",
+        "_loaded",
+    )
+
     def __init__(
         self,
         method: str = "GFN-FF",
@@ -110,6 +124,11 @@ class GFNFFBackend(CalculatorBackend):
             raise RuntimeError("Backend not loaded. Call load() first.")
         return self._calculator
 
+    @calculator.setter
+    def calculator(self, value):
+        """Set the ASE calculator instance."""
+        self._calculator = value
+
     def calculate(
         self,
         atoms,
@@ -134,30 +153,34 @@ class GFNFFBackend(CalculatorBackend):
         if properties is None:
             properties = ['energy', 'forces']
 
-        # Attach calculator to atoms
-        atoms.calc = self._calculator
+        # Attach calculator to atoms (only if not already attached)
+        if atoms.calc is not self._calculator:
+            atoms.calc = self._calculator
 
-        # Calculate requested properties
         results = {}
 
-        if 'energy' in properties:
-            results['energy'] = atoms.get_potential_energy()
+        # Stress is only computed for periodic systems
+        wants_stress = 'stress' in properties
+        if wants_stress and not atoms.pbc.any():
+            # Non-periodic system: zero stress, without asking xTB
+            results['stress'] = _ZERO_STRESS
+            wants_stress = False
+
+        with self._lock:
+            # Calculate requested properties
+            if 'energy' in properties:
+                results['energy'] = atoms.get_potential_energy()
 
-        if 'forces' in properties:
-            results['forces'] = atoms.get_forces()
+            if 'forces' in properties:
+                results['forces'] = atoms.get_forces()
 
-        if 'stress' in properties:
-            # Check if system is periodic
-            if any(atoms.get_pbc()):
+            if wants_stress:
                 try:
                     results['stress'] = atoms.get_stress(voigt=True)
                 except Exception as e:
                     logger.warning(f"Could not calculate stress: {e}")
                     # Return zero stress if calculation fails
-                    results['stress'] = np.zeros(6)
-            else:
-                # Non-periodic system, return zero stress
-                results['stress'] = np.zeros(6)
+                    results['stress'] = _ZERO_STRESS
 
         return results
 
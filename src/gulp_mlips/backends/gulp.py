@@ -12,14 +12,63 @@ for more reliable access to forces and stress.
 from typing import Optional, List, Dict, Any
 import numpy as np
 import os
+import sys
 import tempfile
 import shutil
 import logging
+import threading
+import importlib.util
 
 from gulp_mlips.backends.base import CalculatorBackend
 
 logger = logging.getLogger(__name__)
 
+# Shared stress result for failed/unavailable stress (read-only, never copied)
+_ZERO_STRESS = np.zeros(6)
+_ZERO_STRESS.setflags(write=False)
+
+# gulp_drv_calculator module, loaded once per process
+_GULP_DRV_MODULE = None
+_GULP_DRV_LOCK = threading.Lock()
+
+
+def _load_gulp_drv_module():
+    """Import gulp_drv_calculator, once per process.
+
+    An importable gulp_drv_calculator (e.g. on PYTHONPATH) is preferred,
+    so its compiled bytecode is cached; otherwise the copy in the project
+    root is loaded.
+
+    Returns:
+        The gulp_drv_calculator module
+
+    Raises:
+        FileNotFoundError: If gulp_drv_calculator cannot be found
+    """
+    global _GULP_DRV_MODULE
+    with _GULP_DRV_LOCK:
+        if _GULP_DRV_MODULE is None:
+            try:
+                import gulp_drv_calculator as module
+            except ImportError:
+                # Load gulp_drv_calculator from the project root
+                project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+                gulp_drv_path = os.path.join(project_root, "gulp_drv_calculator.py")
+
+                if not os.path.exists(gulp_drv_path):
+                    raise FileNotFoundError(
+                        f"gulp_drv_calculator.py not found at {gulp_drv_path}"
+                    )
+
+                spec = importlib.util.spec_from_file_location("gulp_drv_calculator", gulp_drv_path)
+                module = importlib.util.module_from_spec(spec)
+                sys.modules["gulp_drv_calculator"] = module
+                spec.loader.exec_module(module)
+
+            _GULP_DRV_MODULE = module
+
+    return _GULP_DRV_MODULE
+
 
 class GULPBackend(CalculatorBackend):
     """GULP calculator backend using GULP's own potentials.
@@ -35,6 +84,20 @@ class GULPBackend(CalculatorBackend):
         gulp_command: Command to run GULP (default: 'gulp')
     """
 
+    __slots__ = (
+        "keywords",
+        "library",
+        "options",
+        "gulp_command",
+        "_loaded",
+        "_temp_dir",
+        "_wants_stress",
+    )
+
+    # Executable paths and version strings, probed once per gulp_command
+    _which_cache: Dict[str, str] = {}
+    _version_cache: Dict[str, str] = {}
+
     def __init__(
         self,
         keywords: str = "conp gradient",
@@ -59,6 +122,7 @@ class GULPBackend(CalculatorBackend):
         self.gulp_command = gulp_command
         self._loaded = False
         self._temp_dir = None
+        self._wants_stress = False
 
     def load(self) -> None:
         """Load the GULP calculator."""
@@ -66,7 +130,11 @@ class GULPBackend(CalculatorBackend):
             return
 
         # Check if GULP is available
-        gulp_path = shutil.which(self.gulp_command)
+        gulp_path = self._which_cache.get(self.gulp_command)
+        if gulp_path is None:
+            gulp_path = shutil.which(self.gulp_command)
+            if gulp_path is not None:
+                self._which_cache[self.gulp_command] = gulp_path
         if gulp_path is None:
             raise RuntimeError(
                 f"GULP not found. Please install GULP and ensure '{self.gulp_command}' "
@@ -86,25 +154,8 @@ class GULPBackend(CalculatorBackend):
             os.environ['GULP_LIB'] = ""
             logger.info("  Note: GULP_LIB not set, using empty value")
 
-        # Import here to avoid requiring gulp_drv_calculator at import time
-        import sys
-        import importlib.util
-
-        # Load gulp_drv_calculator from the project root
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-        gulp_drv_path = os.path.join(project_root, "gulp_drv_calculator.py")
-
-        if not os.path.exists(gulp_drv_path):
-            raise FileNotFoundError(
-                f"gulp_drv_calculator.py not found at {gulp_drv_path}"
-            )
-
-        spec = importlib.util.spec_from_file_location("gulp_drv_calculator", gulp_drv_path)
-        gulp_drv_module = importlib.util.module_from_spec(spec)
-        sys.modules["gulp_drv_calculator"] = gulp_drv_module
-        spec.loader.exec_module(gulp_drv_module)
-
-        GULPDrvCalculator = gulp_drv_module.GULPDrvCalculator
+        # Imported here to avoid requiring gulp_drv_calculator at import time
+        GULPDrvCalculator = _load_gulp_drv_module().GULPDrvCalculator
 
         # Create temporary directory for GULP calculations
         self._temp_dir = tempfile.mkdtemp(prefix="gulp_backend_")
@@ -122,6 +173,9 @@ class GULPBackend(CalculatorBackend):
         gulp_path_expanded = os.path.expanduser(gulp_path)
         self.calculator.command = f"{gulp_path_expanded} < PREFIX.gin > PREFIX.got"
 
+        # GULP only reports stress when asked to in the keywords
+        self._wants_stress = 'stress' in self.keywords.lower()
+
         self._loaded = True
         logger.info(f"GULP calculator loaded successfully")
 
@@ -149,30 +203,35 @@ class GULPBackend(CalculatorBackend):
         if properties is None:
             properties = ['energy', 'forces']
 
-        # Attach calculator to atoms
-        atoms.calc = self.calculator
+        # Attach calculator to atoms (only if not already attached)
+        if atoms.calc is not self.calculator:
+            atoms.calc = self.calculator
 
-        # Calculate requested properties
         results = {}
 
-        if 'energy' in properties:
-            results['energy'] = atoms.get_potential_energy()
+        # Stress is only computed for periodic systems
+        wants_stress = 'stress' in properties
+        if wants_stress and not (self._wants_stress and atoms.pbc.any()):
+            # Non-periodic system or stress not in keywords: zero stress,
+            # without asking GULP
+            results['stress'] = _ZERO_STRESS
+            wants_stress = False
 
-        if 'forces' in properties:
-            results['forces'] = atoms.get_forces()
+        with self._lock:
+            # Calculate requested properties
+            if 'energy' in properties:
+                results['energy'] = atoms.get_potential_energy()
 
-        if 'stress' in properties:
-            # Check if system is periodic and if stress is in keywords
-            if any(atoms.get_pbc()) and 'stress' in self.keywords.lower():
+            if 'forces' in properties:
+                results['forces'] = atoms.get_forces()
+
+            if wants_stress:
                 try:
                     results['stress'] = atoms.get_stress(voigt=True)
                 except Exception as e:
                     logger.warning(f"Could not calculate stress: {e}")
                     # Return zero stress if calculation fails
-                    results['stress'] = np.zeros(6)
-            else:
-                # Non-periodic system or stress not requested, return zero
-                results['stress'] = np.zeros(6)
+                    results['stress'] = _ZERO_STRESS
 
         return results
 
@@ -181,7 +240,19 @@ class GULPBackend(CalculatorBackend):
         return "GULP"
 
     def get_version(self) -> str:
-        """Get GULP version."""
+        """Get GULP version.
+
+        The version is probed by running GULP once per gulp_command and
+        cached for later calls.
+        """
+        version = self._version_cache.get(self.gulp_command)
+        if version is None:
+            version = self._probe_version()
+            self._version_cache[self.gulp_command] = version
+        return version
+
+    def _probe_version(self) -> str:
+        """Run GULP to find its version string."""
         try:
             import subprocess
             result = subprocess.run(
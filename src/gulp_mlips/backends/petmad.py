@@ -1,8 +1,15 @@
 """PET-MAD calculator backend for gulp-mlips."""
 
 import logging
-from typing import Optional
-from .base import CalculatorBackend
+from typing import Any, Dict, Optional
+from ase import Atoms
+from ase.stress import full_3x3_to_voigt_6_stress
+from .base import (
+    CalculatorBackend,
+    construct_on_device,
+    prefetch_files,
+    set_matmul_precision,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -13,10 +20,13 @@ class PETMADBackend(CalculatorBackend):
     Uses the pet-mad package via ASE calculator interface.
     """
 
+    __slots__ = ("version", "device", "matmul_precision")
+
     def __init__(
         self,
         version: str = "latest",
         device: str = "cpu",
+        matmul_precision: Optional[str] = "high",
         **kwargs
     ):
         """Initialize PET-MAD backend.
@@ -24,11 +34,19 @@ class PETMADBackend(CalculatorBackend):
         Args:
             version: PET-MAD model version ("latest", "v1.0", etc.)
             device: Device to use ("cpu", "cuda", etc.)
+            matmul_precision: Float32 matmul precision on CUDA ("highest",
+                "high" or "medium"); "high" enables TF32 tensor cores
             **kwargs: Additional arguments passed to PETMADCalculator
         """
-        super().__init__(version=version, device=device, **kwargs)
+        super().__init__(
+            version=version,
+            device=device,
+            matmul_precision=matmul_precision,
+            **kwargs
+        )
         self.version = version
         self.device = device
+        self.matmul_precision = matmul_precision
 
     def load(self) -> None:
         """Load PET-MAD calculator.
@@ -47,15 +65,121 @@ class PETMADBackend(CalculatorBackend):
 
         try:
             logger.info(f"Loading PET-MAD calculator: version={self.version}, device={self.device}")
-            self.calculator = PETMADCalculator(
-                version=self.version,
-                device=self.device,
-                **{k: v for k, v in self.config.items() if k not in ['version', 'device']}
+            set_matmul_precision(self.device, self.matmul_precision)
+
+            # Pre-read the checkpoint so the model loads from the page cache
+            checkpoint_path = self._checkpoint_path()
+            if checkpoint_path is not None:
+                prefetch_files([checkpoint_path])
+
+            self.calculator = construct_on_device(
+                self.device,
+                lambda: PETMADCalculator(
+                    version=self.version,
+                    device=self.device,
+                    **{k: v for k, v in self.config.items() if k not in ['version', 'device', 'matmul_precision']}
+                ),
             )
             logger.info("PET-MAD calculator loaded successfully")
         except Exception as e:
             raise RuntimeError(f"Failed to load PET-MAD calculator: {e}") from e
 
+    def _checkpoint_path(self) -> Optional[str]:
+        """Resolve the local PET-MAD checkpoint, downloading it if needed.
+
+        Returns:
+            Path to the checkpoint file, or None if it cannot be resolved
+            (the calculator then downloads it itself)
+        """
+        if self.config.get("checkpoint_path"):
+            return self.config["checkpoint_path"]
+
+        url = self.checkpoint_url()
+        if url is None:
+            return None
+
+        try:
+            from pet_mad.utils import hf_hub_download_url
+
+            return hf_hub_download_url(url)
+        except Exception as e:
+            logger.debug(f"Could not resolve PET-MAD checkpoint for prefetch: {e}")
+            return None
+
+    def checkpoint_url(self) -> Optional[str]:
+        """Get the Hugging Face Hub URL of the PET-MAD checkpoint.
+
+        pet-mad has no public API for this, so the URL is built from its
+        private BASE_URL and version constants. This is best effort: if a
+        pet-mad release moves them, None is returned and callers skip the
+        checkpoint prefetch and cache check.
+
+        Returns:
+            URL of the checkpoint for the configured version, or None if it
+            cannot be determined
+        """
+        try:
+            from pet_mad._models import BASE_URL
+            from pet_mad._version import PET_MAD_LATEST_STABLE_VERSION
+        except (ImportError, AttributeError) as e:
+            logger.debug(f"Cannot determine the PET-MAD checkpoint URL: {e}")
+            return None
+
+        version = PET_MAD_LATEST_STABLE_VERSION if self.version == "latest" else self.version
+        version = str(version).lstrip("v")
+        return BASE_URL.format(tag=f"v{version}", version=f"v{version}")
+
+    def calculate_batch(
+        self,
+        atoms_list: list[Atoms],
+        properties: list[str] = ["energy", "forces"],
+    ) -> list[Dict[str, Any]]:
+        """Calculate properties for several structures in one model evaluation.
+
+        Uses the batched compute_energy() of the underlying metatomic
+        calculator. Falls back to one calculation per structure if that is
+        not available, or if stress is needed for a batch that is not fully
+        periodic (metatomic only computes stress when every system is).
+
+        Args:
+            atoms_list: List of ASE Atoms objects
+            properties: List of properties to calculate for every structure
+
+        Returns:
+            List of result dictionaries, in the same order as atoms_list
+        """
+        if not self.is_loaded():
+            raise RuntimeError("Calculator not loaded. Call load() first.")
+
+        model = getattr(self.calculator, "calculator", None)
+        wants_stress = "stress" in properties and any(a.pbc.any() for a in atoms_list)
+        all_periodic = all(a.pbc.all() for a in atoms_list)
+        if not hasattr(model, "compute_energy") or (wants_stress and not all_periodic):
+            return super().calculate_batch(atoms_list, properties)
+
+        with self._lock:
+            outputs = model.compute_energy(
+                atoms_list,
+                compute_forces_and_stresses="forces" in properties or wants_stress,
+            )
+
+        results = []
+        for i, atoms in enumerate(atoms_list):
+            result = {}
+            if "energy" in properties:
+                result["energy"] = float(outputs["energy"][i])
+            if "forces" in properties:
+                result["forces"] = outputs["forces"][i]
+            if "stress" in properties:
+                result["stress"] = (
+                    full_3x3_to_voigt_6_stress(outputs["stress"][i])
+                    if wants_stress
+                    else None
+                )
+            results.append(result)
+
+        return results
+
     def get_name(self) -> str:
         """Get backend name.
 
@@ -0,0 +1,62 @@
+"""Registry of calculator backends for gulp-mlips.
+
+Maps backend names to the module and class implementing them. Backend
+modules are only imported once selected, so optional dependencies of the
+other backends are never loaded.
+"""
+
+import importlib
+
+from .base import CalculatorBackend
+
+BACKENDS = {
+    'petmad': ('gulp_mlips.backends.petmad', 'PETMADBackend'),
+    'fairchem': ('gulp_mlips.backends.fairchem', 'FairChemBackend'),
+    'gfnff': ('gulp_mlips.backends.gfnff', 'GFNFFBackend'),
+    'xtb': ('gulp_mlips.backends.gfnff', 'GFNFFBackend'),  # Alias for gfnff
+    'gulp': ('gulp_mlips.backends.gulp', 'GULPBackend'),
+}
+
+
+def get_backend_class(backend_name: str) -> type:
+    """Import and return the class of a registered backend.
+
+    Args:
+        backend_name: Name of backend ('petmad', 'fairchem', etc.)
+
+    Returns:
+        CalculatorBackend subclass
+
+    Raises:
+        ValueError: If backend_name is unknown
+    """
+    entry = BACKENDS.get(backend_name.lower())
+    if entry is None:
+        raise ValueError(
+            f"Unknown backend: {backend_name}. "
+            f"Available: {', '.join(BACKENDS.keys())}"
+        )
+
+    module_name, class_name = entry
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def load_backend(backend_name: str, **config) -> CalculatorBackend:
+    """Create and load a calculator backend.
+
+    Args:
+        backend_name: Name of backend ('petmad', 'fairchem', etc.)
+        **config: Backend-specific configuration
+
+    Returns:
+        Loaded CalculatorBackend instance
+
+    Raises:
+        ValueError: If backend_name is unknown
+        RuntimeError: If loading fails
+    """
+    BackendClass = get_backend_class(backend_name)
+    backend_instance = BackendClass(**config)
+    backend_instance.load()
+
+    return backend_instance
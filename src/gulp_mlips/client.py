@@ -8,22 +8,308 @@ This script is called by GULP to perform calculations:
 
 Usage:
     gulp-mlips-client input.xyz output.drv [--port 8193]
+    gulp-mlips-client --serve-socket /tmp/gulp-mlips-client.sock [--port 8193]
 """
 
+import os
 import sys
+import json
+import socket
+import stat
 import argparse
+import importlib
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, TextIO
 import requests
-import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
 
-from gulp_mlips.formats.readers import read_structure
-from gulp_mlips.formats.drv import write_drv
+from gulp_mlips import transport
+
+
+class _LazyModule:
+    """Stand-in for a module that is imported on first attribute access."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+# numpy (and ASE, via the format modules imported inside the calculation
+# functions) are only loaded once a calculation runs, keeping --help,
+# argument errors and resident-mode start-up fast
+np = _LazyModule("numpy")
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# URL prefix for requests sent over a Unix domain socket
+UNIX_URL = "http+unix://gulp-mlips"
+
+
+class UnixHTTPConnection(HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, socket_path: str, **kwargs):
+        super().__init__("localhost", **kwargs)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+class UnixHTTPConnectionPool(HTTPConnectionPool):
+    """Connection pool whose connections use a Unix domain socket."""
+
+    def __init__(self, socket_path: str, **kwargs):
+        super().__init__("localhost", **kwargs)
+        self.socket_path = socket_path
+
+    def _new_conn(self):
+        return UnixHTTPConnection(self.socket_path, timeout=self.timeout.connect_timeout)
+
+
+class UnixSocketAdapter(HTTPAdapter):
+    """Transport adapter routing UNIX_URL requests to a Unix domain socket.
+
+    Args:
+        socket_path: Path of the socket the host listens on (gulp-mlips-host --uds)
+    """
+
+    def __init__(self, socket_path: str, **kwargs):
+        self.socket_path = socket_path
+        self._pool = UnixHTTPConnectionPool(socket_path, maxsize=1)
+        super().__init__(**kwargs)
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        return self._pool
+
+    def get_connection(self, url, proxies=None):
+        # requests < 2.32
+        return self._pool
+
+    def close(self):
+        self._pool.close()
+        super().close()
+
+
+# Backend used in place of the host when GULP_MLIPS_INPROC is set
+_BACKEND = None
+
+# Shared session: keeps the connection to the host alive between requests
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+
+def get_server_url(host: str, port: int, uds: Optional[str] = None) -> str:
+    """Return the base URL of the host server.
+
+    Args:
+        host: Host server address
+        port: Host server port
+        uds: Unix domain socket path; overrides host and port when given
+
+    Returns:
+        Base URL for requests made with the shared session
+    """
+    if uds is None:
+        return f"http://{host}:{port}"
+
+    adapter = _SESSION.adapters.get(UNIX_URL)
+    if adapter is None or adapter.socket_path != uds:
+        _SESSION.mount(UNIX_URL, UnixSocketAdapter(uds))
+    return UNIX_URL
+
+
+def decode_binary_response(response: requests.Response) -> dict:
+    """Decode a binary (application/octet-stream) response from the host.
+
+    The body holds the raw forces buffer; energy, stress and metadata are
+    carried in headers.
+
+    Args:
+        response: HTTP response from the host's /calculate endpoint
+
+    Returns:
+        Result dictionary with the same keys as the JSON response
+    """
+    headers = response.headers
+    shape = tuple(int(n) for n in headers["X-Forces-Shape"].split(","))
+    forces = np.frombuffer(response.content, dtype=headers["X-Forces-Dtype"]).reshape(shape)
+    stress = headers.get("X-Stress")
+
+    return {
+        "energy": float(headers["X-Energy"]),
+        "forces": forces,
+        "stress": [float(s) for s in stress.split(",")] if stress else None,
+        "backend": headers["X-Backend"],
+        "version": headers["X-Backend-Version"],
+    }
+
+
+def decode_json_stream(response: requests.Response, natoms: int) -> dict:
+    """Decode a streamed JSON response, parsing forces straight into an array.
+
+    Forces are written into a preallocated (natoms, 3) array as they are
+    parsed, instead of building a list of lists first. Requires ijson and
+    a response requested with stream=True.
+
+    Args:
+        response: Streamed HTTP response from the host's /calculate endpoint
+        natoms: Number of atoms in the structure
+
+    Returns:
+        Result dictionary with the same keys as the JSON response
+
+    Raises:
+        ValueError: If the number of force components does not match natoms
+    """
+    response.raw.decode_content = True
+
+    forces = np.empty(natoms * 3)
+    count = 0
+    stress = []
+    result = {"stress": None}
+
+    for prefix, event, value in ijson.parse(response.raw, use_float=True):
+        if prefix == "forces.item.item":
+            forces[count] = value
+            count += 1
+        elif prefix == "stress.item":
+            stress.append(value)
+        elif prefix in ("energy", "backend", "version"):
+            result[prefix] = value
+
+    if count != forces.size:
+        raise ValueError(f"Expected {forces.size} force components, received {count}")
+
+    result["forces"] = forces.reshape(natoms, 3)
+    if stress:
+        result["stress"] = stress
+    return result
+
+
+def _json_default(obj):
+    """Serialize NumPy arrays for the stdlib json fallback."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Cannot serialize object of type {type(obj).__name__}")
+
+
+def encode_json(data: dict) -> bytes:
+    """Encode a request as JSON, serializing NumPy arrays directly.
+
+    Uses orjson when installed (arrays are written straight from their
+    buffers), otherwise the standard library json module.
+
+    Args:
+        data: Request data, which may contain NumPy arrays
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, default=_json_default).encode()
+
+
+def get_local_backend():
+    """Load (once) the backend used for in-process calculations.
+
+    The backend is chosen with GULP_MLIPS_BACKEND (default: petmad) and,
+    optionally, GULP_MLIPS_DEVICE. It stays loaded for the lifetime of
+    the process, so this only pays off for a resident client (--serve or
+    --serve-socket).
+
+    Returns:
+        Loaded CalculatorBackend instance
+    """
+    global _BACKEND
+    if _BACKEND is None:
+        from gulp_mlips.backends.registry import load_backend
+
+        backend_name = os.environ.get("GULP_MLIPS_BACKEND", "petmad")
+        config = {}
+        if os.environ.get("GULP_MLIPS_DEVICE"):
+            config["device"] = os.environ["GULP_MLIPS_DEVICE"]
+
+        logger.info(f"Loading in-process backend: {backend_name}")
+        _BACKEND = load_backend(backend_name, **config)
+    return _BACKEND
+
+
+def calculate_in_process(atoms, properties: list) -> dict:
+    """Calculate properties with a backend loaded in this process.
+
+    Skips HTTP entirely: no request encoding, no network round trip and
+    no server-side routing.
+
+    Args:
+        atoms: ASE Atoms object
+        properties: List of properties to calculate
+
+    Returns:
+        Result dictionary with the same keys as the host's response
+    """
+    backend = get_local_backend()
+    result = dict(backend.calculate(atoms, properties=properties))
+    result["backend"] = backend.get_name()
+    result["version"] = backend.get_version()
+    return result
+
+
+def post_msgpack(
+    server_url: str,
+    request_data: dict,
+    timeout: int,
+) -> Optional[requests.Response]:
+    """Send a calculation request to the host's msgpack endpoint.
+
+    Positions, cell and atomic numbers are sent as raw buffers (see
+    gulp_mlips.transport), avoiding the JSON float round trip.
+
+    Args:
+        server_url: Base URL of the host server
+        request_data: Request with "structure" and "properties"; arrays
+            may be NumPy arrays
+        timeout: Request timeout in seconds
+
+    Returns:
+        HTTP response, or None if the host does not accept msgpack
+    """
+    response = _SESSION.post(
+        f"{server_url}/calculate/msgpack",
+        data=transport.packb(request_data),
+        headers={"Content-Type": transport.MSGPACK_MEDIA_TYPE},
+        timeout=timeout,
+    )
+
+    # Older hosts (404) or hosts without msgpack (415): use JSON instead
+    if response.status_code in (404, 415):
+        logger.debug("Host does not accept msgpack, falling back to JSON")
+        return None
+    return response
+
 
 def calculate_via_host(
     input_file: str,
@@ -32,6 +318,7 @@ def calculate_via_host(
     host: str = "127.0.0.1",
     timeout: int = 300,
     format: Optional[str] = None,
+    uds: Optional[str] = None,
 ) -> bool:
     """Perform calculation via host server.
 
@@ -42,10 +329,14 @@ def calculate_via_host(
         host: Host server address
         timeout: Request timeout in seconds
         format: Input file format (None = auto-detect)
+        uds: Unix domain socket path of the host (overrides host and port)
 
     Returns:
         True if successful, False otherwise
     """
+    from gulp_mlips.formats.readers import read_structure
+    from gulp_mlips.formats.drv import write_drv
+
     try:
         # Read structure
         logger.info(f"Reading structure from {input_file}")
@@ -54,58 +345,91 @@ def calculate_via_host(
 
         # Prepare request
         # For periodic systems, also request stress for strain gradients
-        is_periodic = any(atoms.get_pbc())
+        pbc = atoms.pbc
+        is_periodic = bool(pbc.any())
         properties = ["energy", "forces"]
         if is_periodic:
             properties.append("stress")
-
-        request_data = {
-            "structure": {
-                "symbols": atoms.get_chemical_symbols(),
-                "positions": atoms.get_positions().tolist(),
-            },
-            "properties": properties,
-        }
-
-        # Add cell and PBC if periodic
-        if is_periodic:
-            request_data["structure"]["cell"] = atoms.get_cell().tolist()
-            request_data["structure"]["pbc"] = atoms.get_pbc().tolist()
-            logger.info(f"  Periodic: {atoms.get_pbc()}")
-
-        # Send request to host
-        server_url = f"http://{host}:{port}"
-        logger.info(f"Sending request to {server_url}/calculate")
-
-        try:
-            response = requests.post(
-                f"{server_url}/calculate",
-                json=request_data,
-                timeout=timeout,
-            )
-
-            if response.status_code != 200:
-                error_msg = response.json().get("detail", "Unknown error") if response.headers.get("content-type") == "application/json" else response.text
-                logger.error(f"Server returned status {response.status_code}")
-                logger.error(f"  {error_msg}")
+            logger.info(f"  Periodic: {pbc}")
+
+        if os.environ.get("GULP_MLIPS_INPROC"):
+            result = calculate_in_process(atoms, properties)
+        else:
+            # Send request to host
+            server_url = get_server_url(host, port, uds)
+            logger.info(f"Sending request to {server_url}/calculate")
+
+            try:
+                # Built once from the Atoms arrays; both encoders take NumPy
+                # arrays directly
+                structure = {"positions": atoms.positions}
+                if is_periodic:
+                    structure["cell"] = atoms.cell.array
+                    structure["pbc"] = [bool(p) for p in pbc]
+
+                response = None
+                streamed = False
+                if transport.MSGPACK_AVAILABLE:
+                    # Atomic numbers pack as one raw integer buffer rather
+                    # than a list of per-atom symbol strings
+                    response = post_msgpack(
+                        server_url,
+                        {
+                            "structure": {"numbers": atoms.numbers, **structure},
+                            "properties": properties,
+                        },
+                        timeout,
+                    )
+
+                if response is None:
+                    structure["symbols"] = atoms.get_chemical_symbols()
+                    request_data = {"structure": structure, "properties": properties}
+
+                    # With ijson, JSON forces are parsed while streaming
+                    streamed = ijson is not None
+
+                    # Prefer raw binary forces; older hosts ignore this and send JSON
+                    response = _SESSION.post(
+                        f"{server_url}/calculate",
+                        data=encode_json(request_data),
+                        headers={
+                            "Content-Type": "application/json",
+                            "Accept": "application/octet-stream, application/json",
+                        },
+                        timeout=timeout,
+                        stream=streamed,
+                    )
+
+                if response.status_code != 200:
+                    error_msg = response.json().get("detail", "Unknown error") if response.headers.get("content-type") == "application/json" else response.text
+                    logger.error(f"Server returned status {response.status_code}")
+                    logger.error(f"  {error_msg}")
+                    return False
+
+                content_type = response.headers.get("content-type")
+                if content_type == transport.MSGPACK_MEDIA_TYPE:
+                    result = transport.unpackb(response.content)
+                elif content_type == "application/octet-stream":
+                    result = decode_binary_response(response)
+                elif streamed:
+                    result = decode_json_stream(response, len(atoms))
+                else:
+                    result = response.json()
+
+            except requests.exceptions.ConnectionError:
+                logger.error(f"Cannot connect to server at {uds or f'{host}:{port}'}")
+                logger.error(f"  Make sure the host server is running:")
+                logger.error(f"    gulp-mlips-host --backend petmad --port {port}")
                 return False
 
-            result = response.json()
-
-        except requests.exceptions.ConnectionError:
-            logger.error(f"Cannot connect to server at {host}:{port}")
-            logger.error(f"  Make sure the host server is running:")
-            logger.error(f"    gulp-mlips-host --backend petmad --port {port}")
-            return False
-
-        except requests.exceptions.Timeout:
-            logger.error(f"Request timed out after {timeout} seconds")
-            return False
+            except requests.exceptions.Timeout:
+                logger.error(f"Request timed out after {timeout} seconds")
+                return False
 
         # Extract results
         energy = result["energy"]
-        forces = np.array(result["forces"])
-        stress = np.array(result["stress"]) if result.get("stress") else None
+        forces = np.asarray(result["forces"], dtype=np.float64)
+        stress = np.asarray(result["stress"], dtype=np.float64) if result.get("stress") is not None else None
 
         logger.info(f"Calculation complete:")
         logger.info(f"  Energy: {energy:.6f} eV")
@@ -133,6 +457,185 @@ def calculate_via_host(
         return False
 
 
+def calculate_batch_via_host(
+    input_files: List[str],
+    output_dir: str,
+    port: int = 8193,
+    host: str = "127.0.0.1",
+    timeout: int = 300,
+    format: Optional[str] = None,
+    uds: Optional[str] = None,
+) -> bool:
+    """Calculate several structures in one host request.
+
+    Useful for NEB images or independent replicas: the host evaluates
+    all structures with one batched backend call. One .drv file is
+    written per input, named after the input file (image_01.xyz ->
+    output_dir/image_01.drv). The host limits the number of structures
+    per request (gulp-mlips-host --max-request-structures).
+
+    Args:
+        input_files: Paths to input structure files
+        output_dir: Directory for the output .drv files
+        port: Host server port
+        host: Host server address
+        timeout: Request timeout in seconds
+        format: Input file format (None = auto-detect)
+        uds: Unix domain socket path of the host (overrides host and port)
+
+    Returns:
+        True if successful, False otherwise
+    """
+    from gulp_mlips.formats.readers import read_structure
+    from gulp_mlips.formats.drv import write_drv
+
+    try:
+        atoms_list = [read_structure(path, format=format) for path in input_files]
+        logger.info(f"Read {len(atoms_list)} structures")
+
+        properties = ["energy", "forces"]
+        if any(atoms.pbc.any() for atoms in atoms_list):
+            properties.append("stress")
+
+        if os.environ.get("GULP_MLIPS_INPROC"):
+            backend = get_local_backend()
+            results = backend.calculate_batch(atoms_list, properties)
+        else:
+            structures = []
+            for atoms in atoms_list:
+                structure = {
+                    "symbols": atoms.get_chemical_symbols(),
+                    "positions": atoms.positions,
+                }
+                if atoms.pbc.any():
+                    structure["cell"] = atoms.cell.array
+                    structure["pbc"] = [bool(p) for p in atoms.pbc]
+                structures.append(structure)
+
+            server_url = get_server_url(host, port, uds)
+            logger.info(f"Sending {len(structures)} structures to {server_url}/calculate_batch")
+
+            try:
+                response = _SESSION.post(
+                    f"{server_url}/calculate_batch",
+                    data=encode_json({"structures": structures, "properties": properties}),
+                    headers={"Content-Type": "application/json"},
+                    timeout=timeout,
+                )
+            except requests.exceptions.ConnectionError:
+                logger.error(f"Cannot connect to server at {uds or f'{host}:{port}'}")
+                return False
+            except requests.exceptions.Timeout:
+                logger.error(f"Request timed out after {timeout} seconds")
+                return False
+
+            if response.status_code != 200:
+                error_msg = response.json().get("detail", "Unknown error") if response.headers.get("content-type") == "application/json" else response.text
+                logger.error(f"Server returned status {response.status_code}")
+                logger.error(f"  {error_msg}")
+                return False
+
+            results = response.json()["results"]
+
+        # Write one .drv file per structure
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        for input_file, atoms, result in zip(input_files, atoms_list, results):
+            output_file = Path(output_dir) / (Path(input_file).stem + ".drv")
+            forces = np.asarray(result["forces"], dtype=np.float64)
+            # Stress is requested for the whole batch; molecules in a mixed
+            # batch may still get one back (e.g. zeros) and have no volume
+            stress = None
+            if result.get("stress") is not None and atoms.pbc.any():
+                stress = np.asarray(result["stress"], dtype=np.float64)
+            write_drv(str(output_file), atoms, result["energy"], forces, stress)
+            logger.info(f"  {input_file}: {result['energy']:.6f} eV -> {output_file}")
+
+        return True
+
+    except FileNotFoundError as e:
+        logger.error(f"File not found: {e}")
+        return False
+
+    except ValueError as e:
+        logger.error(f"{e}")
+        return False
+
+    except Exception as e:
+        logger.error(f"Unexpected error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def serve(stream_in: TextIO, stream_out: TextIO, **kwargs) -> None:
+    """Handle calculation requests from a stream, one per line.
+
+    Each request line holds an input and an output path separated by a
+    tab. After the calculation "OK" or "ERR" is written back on its own
+    line. Keeping one client process resident this way avoids paying the
+    Python and NumPy import cost on every GULP force call.
+
+    Args:
+        stream_in: Stream to read request lines from
+        stream_out: Stream to write replies to
+        **kwargs: Passed on to calculate_via_host()
+    """
+    for line in stream_in:
+        line = line.rstrip("\r\n")
+        if not line:
+            continue
+
+        try:
+            input_file, output_file = line.split("\t")
+        except ValueError:
+            logger.error(f"Malformed request (expected input<TAB>output): {line!r}")
+            success = False
+        else:
+            success = calculate_via_host(input_file, output_file, **kwargs)
+
+        stream_out.write("OK\n" if success else "ERR\n")
+        stream_out.flush()
+
+
+def serve_socket(socket_path: str, **kwargs) -> None:
+    """Serve calculation requests on a Unix domain socket.
+
+    Connections are handled one at a time with the protocol of serve();
+    gulp-mlips-external is the matching launcher for GULP.
+
+    Args:
+        socket_path: Path of the socket to listen on
+        **kwargs: Passed on to calculate_via_host()
+    """
+    # Replace a stale socket from an earlier run, but never another file
+    try:
+        mode = os.lstat(socket_path).st_mode
+    except FileNotFoundError:
+        pass
+    else:
+        if not stat.S_ISSOCK(mode):
+            logger.error(f"Refusing to replace {socket_path}: not a socket")
+            sys.exit(1)
+        os.unlink(socket_path)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen()
+    logger.info(f"Serving requests on {socket_path}")
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn, conn.makefile("r") as stream_in, conn.makefile("w") as stream_out:
+                try:
+                    serve(stream_in, stream_out, **kwargs)
+                except OSError as e:
+                    logger.warning(f"Connection closed: {e}")
+    finally:
+        server.close()
+        os.unlink(socket_path)
+
+
 def main():
     """Main entry point for client script."""
     parser = argparse.ArgumentParser(
@@ -146,9 +649,28 @@ Examples:
   # Specify port if host is running on non-default port
   gulp-mlips-client input.xyz output.drv --port 8194
 
+  # Connect over a Unix domain socket (host started with --uds)
+  gulp-mlips-client input.xyz output.drv --uds /tmp/gulp-mlips.sock
+
+  # Read the structure from stdin (XYZ unless --format is given)
+  cat input.xyz | gulp-mlips-client - output.drv
+
   # Specify input format explicitly
   gulp-mlips-client structure.in output.drv --format cssr
 
+  # Calculate NEB images in one batched request (one .drv per image)
+  gulp-mlips-client --batch 'image_*.xyz' drv_out/
+
+  # Stay resident and take "input<TAB>output" requests on stdin
+  gulp-mlips-client --serve
+
+  # Stay resident on a socket; GULP then calls gulp-mlips-external
+  gulp-mlips-client --serve-socket /tmp/gulp-mlips-client.sock
+
+  # Calculate in this process instead of via the host (set
+  # GULP_MLIPS_BACKEND/GULP_MLIPS_DEVICE; best with a resident client)
+  GULP_MLIPS_INPROC=1 GULP_MLIPS_BACKEND=gfnff gulp-mlips-client --serve-socket /tmp/gulp-mlips-client.sock
+
   # Use with GULP
   In your GULP input file:
     external petmad gulp-mlips-client
@@ -158,12 +680,32 @@ Examples:
 
     parser.add_argument(
         'input',
-        help='Input structure file (XYZ, CSSR, CIF)'
+        nargs='?',
+        help='Input structure file (XYZ, CSSR, CIF), or - for stdin'
     )
     parser.add_argument(
         'output',
+        nargs='?',
         help='Output .drv file'
     )
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Treat input as a glob pattern and output as a directory, and '
+             'calculate all matching structures in one request'
+    )
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Stay resident, reading "input<TAB>output" requests from stdin '
+             'and replying OK/ERR on stdout'
+    )
+    parser.add_argument(
+        '--serve-socket',
+        metavar='PATH',
+        help='Stay resident, taking requests on this Unix domain socket '
+             '(see gulp-mlips-external)'
+    )
     parser.add_argument(
         '--port',
         type=int,
@@ -175,6 +717,12 @@ Examples:
         default='127.0.0.1',
         help='Host server address (default: 127.0.0.1)'
     )
+    parser.add_argument(
+        '--uds',
+        default=os.environ.get("GULP_MLIPS_UDS"),
+        help='Connect to the host over this Unix domain socket instead of TCP '
+             '(default: $GULP_MLIPS_UDS)'
+    )
     parser.add_argument(
         '--timeout',
         type=int,
@@ -201,8 +749,40 @@ Examples:
         format='%(levelname)s: %(message)s'
     )
 
-    # Validate input file exists
-    if not Path(args.input).exists():
+    options = dict(
+        port=args.port,
+        host=args.host,
+        timeout=args.timeout,
+        format=args.format,
+        uds=args.uds,
+    )
+
+    # Resident modes
+    if args.serve_socket:
+        try:
+            serve_socket(args.serve_socket, **options)
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+
+    if args.serve:
+        serve(sys.stdin, sys.stdout, **options)
+        sys.exit(0)
+
+    if args.input is None or args.output is None:
+        parser.error("input and output are required unless --serve or --serve-socket is given")
+
+    if args.batch:
+        import glob
+        input_files = sorted(glob.glob(args.input))
+        if not input_files:
+            logger.error(f"No input files match: {args.input}")
+            sys.exit(1)
+        success = calculate_batch_via_host(input_files, args.output, **options)
+        sys.exit(0 if success else 1)
+
+    # Validate input file exists ("-" reads the structure from stdin)
+    if args.input != '-' and not Path(args.input).exists():
         logger.error(f"Input file not found: {args.input}")
         sys.exit(1)
 
@@ -210,10 +790,7 @@ Examples:
     success = calculate_via_host(
         input_file=args.input,
         output_file=args.output,
-        port=args.port,
-        host=args.host,
-        timeout=args.timeout,
-        format=args.format,
+        **options,
     )
 
     sys.exit(0 if success else 1)
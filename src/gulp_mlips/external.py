@@ -0,0 +1,72 @@
+"""Lightweight launcher for a resident gulp-mlips client.
+
+GULP starts a new process for every external force call. This script only
+imports the standard library and forwards the request to a client started
+with ``gulp-mlips-client --serve-socket``, so each call costs a socket
+round trip rather than a full client start-up.
+
+Usage:
+    gulp-mlips-client --serve-socket /tmp/gulp-mlips-client.sock &
+    gulp-mlips-external input.xyz output.drv --socket /tmp/gulp-mlips-client.sock
+"""
+
+import os
+import sys
+import socket
+import argparse
+
+DEFAULT_SOCKET = "/tmp/gulp-mlips-client.sock"
+
+
+def request(socket_path: str, input_file: str, output_file: str) -> bool:
+    """Ask the resident client to perform one calculation.
+
+    Args:
+        socket_path: Socket the resident client listens on
+        input_file: Path to input structure file
+        output_file: Path to output .drv file
+
+    Returns:
+        True if the resident client reported success, False otherwise
+    """
+    # The resident client may run in a different directory
+    line = f"{os.path.abspath(input_file)}\t{os.path.abspath(output_file)}\n"
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(line.encode())
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile("r") as stream:
+            reply = stream.readline().strip()
+
+    return reply == "OK"
+
+
+def main():
+    """Main entry point for the launcher."""
+    parser = argparse.ArgumentParser(
+        description="Forward a GULP calculation to a resident gulp-mlips-client"
+    )
+    parser.add_argument('input', help='Input structure file (XYZ, CSSR, CIF)')
+    parser.add_argument('output', help='Output .drv file')
+    parser.add_argument(
+        '--socket',
+        default=os.environ.get("GULP_MLIPS_CLIENT_SOCKET", DEFAULT_SOCKET),
+        help='Socket of the resident client (default: $GULP_MLIPS_CLIENT_SOCKET '
+             f'or {DEFAULT_SOCKET})'
+    )
+    args = parser.parse_args()
+
+    try:
+        success = request(args.socket, args.input, args.output)
+    except OSError as e:
+        print(f"ERROR: Cannot reach resident client at {args.socket}: {e}", file=sys.stderr)
+        print("  Start it with: gulp-mlips-client --serve-socket "
+              f"{args.socket}", file=sys.stderr)
+        sys.exit(1)
+
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
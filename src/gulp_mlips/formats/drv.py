@@ -7,10 +7,132 @@ The .drv format contains:
 4. Gradients strain section (for periodic systems)
 """
 
-from typing import Optional
+import io
+import os
+from typing import Optional, TextIO, Tuple
 import numpy as np
 from ase import Atoms
 
+# Per-atom line formats (Fortran: i6,1x,i3,3(1x,f15.8) and i6,3(1x,f15.8))
+COORDINATE_FORMAT = "%6d %3d %15.8f %15.8f %15.8f\n"
+GRADIENT_FORMAT = "%6d %15.8f %15.8f %15.8f\n"
+
+# Strain gradient lines, diagonal then off-diagonal (Fortran: 3(1x,f15.8))
+STRAIN_FORMAT = " %15.8f %15.8f %15.8f\n" * 2
+
+# Indices of the Voigt components (xx, yy, zz, yz, xz, xy) in a 3x3 tensor
+_VOIGT_ROWS = [0, 1, 2, 1, 0, 0]
+_VOIGT_COLUMNS = [0, 1, 2, 2, 2, 1]
+
+# (natoms, index column, coordinate block format, gradient block format) of
+# the last write, reused while the atom count stays the same (e.g. over the
+# steps of a GULP optimisation)
+_block_cache = None
+
+
+def _block_layout(natoms: int) -> Tuple[np.ndarray, str, str]:
+    """Get the index column and per-atom block formats for natoms atoms.
+
+    Args:
+        natoms: Number of atoms
+
+    Returns:
+        Tuple of (1-based index column, coordinate block format,
+        gradient block format)
+    """
+    global _block_cache
+    # Work on a local: another thread may replace the cache meanwhile
+    layout = _block_cache
+    if layout is None or layout[0] != natoms:
+        layout = (
+            natoms,
+            np.arange(1, natoms + 1),
+            COORDINATE_FORMAT * natoms,
+            GRADIENT_FORMAT * natoms,
+        )
+        _block_cache = layout
+    return layout[1:]
+
+
+def _write_drv_to_stream(
+    stream: TextIO,
+    atoms: Atoms,
+    energy: float,
+    forces: np.ndarray,
+    stress: Optional[np.ndarray] = None,
+) -> None:
+    """Write .drv content to an open text stream.
+
+    See write_drv() for the format.
+
+    Args:
+        stream: Writable text stream (file or io.StringIO)
+        atoms: ASE Atoms object with structure
+        energy: Total energy in eV
+        forces: Forces on atoms in eV/Ang (Nx3 array)
+        stress: Optional stress tensor in eV/Ang^3
+
+    Raises:
+        ValueError: If forces shape doesn't match number of atoms
+    """
+    natoms = len(atoms)
+    if forces.shape != (natoms, 3):
+        raise ValueError(
+            f"Forces shape {forces.shape} doesn't match number of atoms {natoms}"
+        )
+
+    # Get atomic positions and atomic numbers (views of the Atoms arrays,
+    # not copies as from get_positions(); do not modify)
+    positions = atoms.positions  # Already in Angstroms
+    atomic_numbers = atoms.numbers
+
+    # Format each per-atom block with a single %-operation over a flat
+    # tuple, so the float -> text conversion runs in C rather than per atom
+    # (np.savetxt still formats and writes one row at a time in Python)
+    index, coordinate_format, gradient_format = _block_layout(natoms)
+    coordinates = np.column_stack((index, atomic_numbers, positions)).ravel().tolist()
+
+    # Convert forces to gradients (GULP convention), negating straight
+    # into the gradient rows rather than through a temporary -forces
+    gradient_rows = np.empty((natoms, 4))
+    gradient_rows[:, 0] = index
+    np.negative(forces, out=gradient_rows[:, 1:])
+    gradient_rows = gradient_rows.ravel().tolist()
+
+    # Energy line - Fortran format: 'energy ',f30.10,' eV'
+    stream.write(f"energy {energy:30.10f} eV\n")
+
+    # Coordinates section
+    stream.write(f"coordinates cartesian Angstroms {natoms:6d}\n")
+    stream.write(coordinate_format % tuple(coordinates))
+
+    # Gradients section
+    stream.write(f"gradients cartesian eV/Ang {natoms:6d}\n")
+    stream.write(gradient_format % tuple(gradient_rows))
+
+    # Gradients strain section (for periodic systems)
+    if stress is not None:
+        stream.write("gradients strain eV\n")
+        # GULP expects strain gradients (dE/dstrain) in eV
+        # ASE provides stress in eV/Ang^3, so we need to multiply by volume
+        # strain_gradient = -stress * volume
+        # (Note: negative sign because ASE stress convention is opposite to strain derivative)
+        volume = atoms.get_volume()
+
+        # GULP expects strain gradients in two lines:
+        # Line 1: diagonal components (xx, yy, zz)
+        # Line 2: off-diagonal components (yz, xz, xy)
+        # Stress should be in Voigt notation: xx, yy, zz, yz, xz, xy
+
+        # Convert stress (eV/Ang^3) to strain gradients (eV)
+        strain_grad = -stress * volume
+        if len(stress) != 6:
+            # Assume 3x3 matrix, gather the Voigt components in one step
+            strain_grad = strain_grad[_VOIGT_ROWS, _VOIGT_COLUMNS]
+
+        # Voigt notation: [xx, yy, zz, yz, xz, xy]
+        stream.write(STRAIN_FORMAT % tuple(strain_grad.tolist()))
+
 
 def write_drv(
     filepath: str,
@@ -18,6 +140,7 @@ def write_drv(
     energy: float,
     forces: np.ndarray,
     stress: Optional[np.ndarray] = None,
+    durable: bool = False,
 ) -> None:
     """Write GULP .drv (derivative) file.
 
@@ -36,78 +159,30 @@ def write_drv(
     Note: GULP expects gradients (not forces), which are the negative of forces.
           drv_gradient = -force
 
+    By default the file is left in the kernel's page cache when this returns,
+    which is all GULP needs to read it back. Pass durable=True to also fsync
+    it to disk, e.g. for the final structure of a long run.
+
     Args:
         filepath: Output .drv file path
         atoms: ASE Atoms object with structure
         energy: Total energy in eV
         forces: Forces on atoms in eV/Ang (Nx3 array)
         stress: Optional stress tensor in eV/Ang^3 (6-component Voigt notation)
+        durable: If True, fsync the file before returning
 
     Raises:
         ValueError: If forces shape doesn't match number of atoms
     """
-    natoms = len(atoms)
-    if forces.shape != (natoms, 3):
-        raise ValueError(
-            f"Forces shape {forces.shape} doesn't match number of atoms {natoms}"
-        )
-
-    # Get atomic positions and atomic numbers
-    positions = atoms.get_positions()  # Already in Angstroms
-    atomic_numbers = atoms.get_atomic_numbers()
-
-    # Convert forces to gradients (GULP convention)
-    # gradients = -forces
-    gradients = -forces
-
+    # Each per-atom block reaches write() as one string, so the default
+    # buffer already gives a handful of write syscalls at any size
     with open(filepath, 'w') as f:
-        # Energy line - Fortran format: 'energy ',f30.10,' eV'
-        f.write(f"energy {energy:30.10f} eV\n")
-
-        # Coordinates section
-        f.write(f"coordinates cartesian Angstroms {natoms:6d}\n")
-        for i, (Z, pos) in enumerate(zip(atomic_numbers, positions), start=1):
-            f.write(f"{i:6d} {Z:3d} {pos[0]:15.8f} {pos[1]:15.8f} {pos[2]:15.8f}\n")
-
-        # Gradients section
-        f.write(f"gradients cartesian eV/Ang {natoms:6d}\n")
-        for i, grad in enumerate(gradients, start=1):
-            f.write(f"{i:6d} {grad[0]:15.8f} {grad[1]:15.8f} {grad[2]:15.8f}\n")
-
-        # Gradients strain section (for periodic systems)
-        if stress is not None:
-            f.write("gradients strain eV\n")
-            # GULP expects strain gradients (dE/dstrain) in eV
-            # ASE provides stress in eV/Ang^3, so we need to multiply by volume
-            # strain_gradient = -stress * volume
-            # (Note: negative sign because ASE stress convention is opposite to strain derivative)
-            volume = atoms.get_volume()
-
-            # GULP expects strain gradients in two lines:
-            # Line 1: diagonal components (xx, yy, zz)
-            # Line 2: off-diagonal components (yz, xz, xy)
-            # Stress should be in Voigt notation: xx, yy, zz, yz, xz, xy
-
-            if len(stress) == 6:
-                # Voigt notation: [xx, yy, zz, yz, xz, xy]
-                # Convert stress (eV/Ang^3) to strain gradients (eV)
-                strain_grad = -stress * volume
-                # Fortran format: 3(1x,f15.8) - each value has 1 space + 15.8 field
-                f.write(f" {strain_grad[0]:15.8f} {strain_grad[1]:15.8f} {strain_grad[2]:15.8f}\n")
-                f.write(f" {strain_grad[3]:15.8f} {strain_grad[4]:15.8f} {strain_grad[5]:15.8f}\n")
-            else:
-                # Assume 3x3 matrix, convert to Voigt
-                strain_grad = -stress * volume
-                sxx, syy, szz = strain_grad[0, 0], strain_grad[1, 1], strain_grad[2, 2]
-                syz, sxz, sxy = strain_grad[1, 2], strain_grad[0, 2], strain_grad[0, 1]
-                # Fortran format: 3(1x,f15.8)
-                f.write(f" {sxx:15.8f} {syy:15.8f} {szz:15.8f}\n")
-                f.write(f" {syz:15.8f} {sxz:15.8f} {sxy:15.8f}\n")
-
-        # Ensure all data is written to disk before returning
-        f.flush()
-        import os
-        os.fsync(f.fileno())
+        _write_drv_to_stream(f, atoms, energy, forces, stress)
+
+        # Only force the data to disk when asked to
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
 
 
 def format_drv_string(
@@ -127,18 +202,6 @@ def format_drv_string(
     Returns:
         String with .drv file content
     """
-    import io
-    from pathlib import Path
-    import tempfile
-
-    # Use temporary file approach
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.drv') as f:
-        temp_path = f.name
-
-    try:
-        write_drv(temp_path, atoms, energy, forces, stress)
-        with open(temp_path, 'r') as f:
-            content = f.read()
-        return content
-    finally:
-        Path(temp_path).unlink(missing_ok=True)
+    buffer = io.StringIO()
+    _write_drv_to_stream(buffer, atoms, energy, forces, stress)
+    return buffer.getvalue()
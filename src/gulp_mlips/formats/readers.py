@@ -3,11 +3,81 @@
 Supports reading structure files in various formats that Fortran/GULP can easily write.
 """
 
+import io
+import re
+import sys
 from typing import Optional, Tuple
 import numpy as np
 from ase import Atoms
 from ase.io import read as ase_read
 
+# Comment-line keys understood by the read_simple_xyz fast path
+_LATTICE_RE = re.compile(r'Lattice="([^"]*)"')
+_PBC_RE = re.compile(r'pbc="([^"]*)"')
+_PROPERTIES_RE = re.compile(r'Properties=(\S+)')
+_PBC_VALUES = {"T": True, "True": True, "F": False, "False": False}
+_XYZ_ROW_DTYPE = [('symbol', 'U8'), ('x', 'f8'), ('y', 'f8'), ('z', 'f8')]
+
+
+def read_simple_xyz(text: str) -> Optional[Atoms]:
+    """Parse a single-frame XYZ with only species and positions.
+
+    This is a fast path for the plain (extended) XYZ files GULP writes:
+    an optional Lattice and pbc on the comment line, and one
+    "Element X Y Z" line per atom. Anything else (extra per-atom columns,
+    several frames, unusual values) is left to ASE's full parser.
+
+    Args:
+        text: Contents of the XYZ file
+
+    Returns:
+        ASE Atoms object, or None if the file needs the full parser
+    """
+    # Only the two header lines are split off in Python
+    first = text.find('\n')
+    second = text.find('\n', first + 1)
+    if first < 0 or second < 0:
+        return None
+    try:
+        natoms = int(text[:first])
+    except ValueError:
+        return None
+    comment = text[first + 1:second]
+
+    properties = _PROPERTIES_RE.search(comment)
+    if natoms == 0 or (properties and properties.group(1) != "species:S:1:pos:R:3"):
+        return None
+
+    try:
+        # Parse the rest of the file in one C-level pass, streaming from a
+        # buffer rather than a list of lines. Raises on any line that is not
+        # exactly "Element X Y Z", including the header of a second frame.
+        data = np.loadtxt(io.StringIO(text[second + 1:]), dtype=_XYZ_ROW_DTYPE, ndmin=1)
+        if len(data) != natoms:
+            return None
+        positions = np.column_stack((data['x'], data['y'], data['z']))
+
+        lattice = _LATTICE_RE.search(comment)
+        cell = None
+        if lattice:
+            cell = np.array(lattice.group(1).split(), dtype=float).reshape(3, 3)
+
+        pbc = _PBC_RE.search(comment)
+        if pbc:
+            pbc = [_PBC_VALUES[value] for value in pbc.group(1).split()]
+        else:
+            # extxyz convention: a lattice without pbc means fully periodic
+            pbc = cell is not None
+
+        return Atoms(
+            symbols=data['symbol'].tolist(),
+            positions=positions,
+            cell=cell,
+            pbc=pbc,
+        )
+    except (KeyError, ValueError):
+        return None
+
 
 def read_xyz(filepath: str) -> Atoms:
     """Read XYZ file and return ASE Atoms object.
@@ -35,6 +105,12 @@ def read_xyz(filepath: str) -> Atoms:
         FileNotFoundError: If file doesn't exist
         ValueError: If file format is invalid
     """
+    # Plain species/positions files (as written by GULP) skip ASE's parser
+    with open(filepath) as f:
+        atoms = read_simple_xyz(f.read())
+    if atoms is not None:
+        return atoms
+
     try:
         # Try extended XYZ first (GULP uses this format)
         atoms = ase_read(filepath, format='extxyz')
@@ -55,7 +131,8 @@ def read_structure(filepath: str, format: Optional[str] = None) -> Atoms:
     Supported formats: xyz, cssr, cif
 
     Args:
-        filepath: Path to structure file
+        filepath: Path to structure file, or "-" to read from stdin
+                  (format defaults to xyz)
         format: Optional format specifier ('xyz', 'cssr', 'cif')
                 If None, infers from file extension
 
@@ -68,7 +145,7 @@ def read_structure(filepath: str, format: Optional[str] = None) -> Atoms:
     """
     if format is None:
         # Infer format from extension
-        ext = filepath.lower().split('.')[-1]
+        ext = 'xyz' if filepath == '-' else filepath.lower().split('.')[-1]
         if ext not in ['xyz', 'cssr', 'cif']:
             raise ValueError(f"Unknown file extension: {ext}. Specify format explicitly.")
         format = ext
@@ -85,14 +162,30 @@ def read_structure(filepath: str, format: Optional[str] = None) -> Atoms:
 
     ase_format = format_map[format]
 
+    # Read the text once; XYZ as written by GULP skips ASE's generic parser
+    text = None
+    if filepath == '-':
+        text = sys.stdin.read()
+    elif format == 'xyz':
+        with open(filepath) as f:
+            text = f.read()
+
+    if format == 'xyz':
+        atoms = read_simple_xyz(text)
+        if atoms is not None:
+            return atoms
+
+    def source():
+        return filepath if text is None else io.StringIO(text)
+
     try:
-        atoms = ase_read(filepath, format=ase_format)
+        atoms = ase_read(source(), format=ase_format)
         return atoms
     except Exception:
         # For XYZ, fallback to standard format if extended fails
         if format == 'xyz':
             try:
-                atoms = ase_read(filepath, format='xyz')
+                atoms = ase_read(source(), format='xyz')
                 return atoms
             except Exception as e:
                 raise ValueError(f"Failed to read {format} file {filepath}: {e}")
@@ -109,13 +202,13 @@ def extract_cell_info(atoms: Atoms) -> Tuple[bool, Optional[np.ndarray]]:
     Returns:
         Tuple of (is_periodic, cell_matrix)
         - is_periodic: True if any dimension is periodic
-        - cell_matrix: 3x3 cell matrix in Angstroms, or None if non-periodic
+        - cell_matrix: 3x3 cell matrix in Angstroms, or None if non-periodic.
+          This is the Atoms object's own cell array, not a copy.
     """
-    pbc = atoms.get_pbc()
-    is_periodic = any(pbc)
+    # Read the arrays directly; get_pbc()/get_cell() return copies
+    is_periodic = bool(atoms.pbc.any())
 
     if is_periodic:
-        cell = atoms.get_cell()
-        return True, np.array(cell)
+        return True, np.asarray(atoms.cell.array)
     else:
         return False, None
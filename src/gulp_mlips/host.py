@@ -10,18 +10,24 @@ This avoids repeatedly loading the MLIP model for each calculation.
 
 import sys
 import argparse
+import asyncio
+import base64
+import binascii
+import importlib.util
 import logging
 from typing import List, Optional, Dict, Any
 import numpy as np
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
-import uvicorn
+from fastapi import FastAPI, HTTPException, Request, Response
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
-from gulp_mlips.backends.base import CalculatorBackend
-from gulp_mlips.backends.petmad import PETMADBackend
-from gulp_mlips.backends.fairchem import FairChemBackend
-from gulp_mlips.backends.gfnff import GFNFFBackend
-from gulp_mlips.backends.gulp import GULPBackend
+from gulp_mlips.backends.base import CalculatorBackend, pack_binary_results
+from gulp_mlips.backends.registry import BACKENDS, load_backend
+from gulp_mlips import transport
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +35,16 @@ logger = logging.getLogger(__name__)
 # Global calculator backend
 backend: Optional[CalculatorBackend] = None
 
+# Optional request batcher (enabled with --batch-window)
+batcher: Optional["MicroBatcher"] = None
+
+# Largest number of structures accepted by /calculate_batch
+max_request_structures = 64
+
+# Species and Atoms object of the last build_atoms(..., reuse=True) call
+_reusable_species = None
+_reusable_atoms = None
+
 app = FastAPI(
     title="gulp-mlips Host Server",
     description="Calculator server for GULP with MLIP backends",
@@ -36,14 +52,79 @@ app = FastAPI(
 )
 
 
+def decode_float64(data: str, count: int, name: str) -> np.ndarray:
+    """Decode a base64 float64 buffer holding exactly count values.
+
+    Args:
+        data: Base64-encoded little-endian float64 bytes
+        count: Expected number of values
+        name: Field name, for error messages
+
+    Returns:
+        Read-only float64 array of length count
+
+    Raises:
+        ValueError: If data is not valid base64 or has the wrong length
+    """
+    try:
+        raw = base64.b64decode(data, validate=True)
+    except binascii.Error as e:
+        raise ValueError(f"{name} is not valid base64: {e}")
+    if len(raw) != 8 * count:
+        raise ValueError(
+            f"{name} holds {len(raw)} bytes, expected {8 * count} ({count} float64 values)"
+        )
+    return np.frombuffer(raw, dtype="<f8")
+
+
 # Pydantic models for API
 class AtomicStructure(BaseModel):
-    """Atomic structure specification."""
+    """Atomic structure specification.
+
+    Positions and cell may be sent as base64-encoded little-endian float64
+    buffers (positions_b64, cell_b64) instead of nested lists, which skips
+    per-float JSON parsing and validation for large structures.
+    """
     symbols: List[str] = Field(..., description="Chemical symbols (e.g., ['C', 'H', 'H'])")
-    positions: List[List[float]] = Field(..., description="Atomic positions in Angstroms (Nx3)")
+    positions: Optional[List[List[float]]] = Field(None, description="Atomic positions in Angstroms (Nx3)")
+    positions_b64: Optional[str] = Field(
+        None, description="Atomic positions as base64-encoded float64 bytes (alternative to positions)"
+    )
     cell: Optional[List[List[float]]] = Field(None, description="Cell matrix in Angstroms (3x3)")
+    cell_b64: Optional[str] = Field(
+        None, description="Cell matrix as base64-encoded float64 bytes (alternative to cell)"
+    )
     pbc: Optional[List[bool]] = Field(None, description="Periodic boundary conditions [x, y, z]")
 
+    # Arrays decoded from positions_b64 and cell_b64 during validation
+    _positions: Optional[np.ndarray] = PrivateAttr(None)
+    _cell: Optional[np.ndarray] = PrivateAttr(None)
+
+    @model_validator(mode="after")
+    def check_positions(self) -> "AtomicStructure":
+        if self.positions is None and self.positions_b64 is None:
+            raise ValueError("Either positions or positions_b64 is required")
+        if self.positions_b64 is not None:
+            natoms = len(self.symbols)
+            self._positions = decode_float64(
+                self.positions_b64, 3 * natoms, "positions_b64"
+            ).reshape(natoms, 3)
+        if self.cell_b64 is not None:
+            self._cell = decode_float64(self.cell_b64, 9, "cell_b64").reshape(3, 3)
+        return self
+
+    def get_positions(self):
+        """Get the positions, decoded from positions_b64 if given (Nx3)."""
+        if self._positions is not None:
+            return self._positions
+        return self.positions
+
+    def get_cell(self):
+        """Get the cell, decoded from cell_b64 if given (3x3 or None)."""
+        if self._cell is not None:
+            return self._cell
+        return self.cell
+
 
 class CalculationRequest(BaseModel):
     """Request for energy/force calculation."""
@@ -63,58 +144,284 @@ class CalculationResponse(BaseModel):
     version: str = Field(..., description="Backend version")
 
 
+class BatchCalculationRequest(BaseModel):
+    """Request for energy/force calculations on several structures."""
+    structures: List[AtomicStructure]
+    properties: List[str] = Field(
+        default=["energy", "forces"],
+        description="Properties to calculate for every structure"
+    )
+
+
+class BatchCalculationResponse(BaseModel):
+    """Response with calculated properties for each structure, in order."""
+    results: List[CalculationResponse]
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
     status: str
     backend_loaded: bool
     backend_name: Optional[str] = None
     backend_version: Optional[str] = None
+    backend_properties: Optional[List[str]] = None
+
+
+class MicroBatcher:
+    """Coalesce concurrent calculation requests into batched backend calls.
+
+    Requests arriving within a short window are evaluated together with
+    CalculatorBackend.calculate_batch(), so backends with batched inference
+    pay the per-call model overhead once per batch. The backend runs in a
+    worker thread, leaving the event loop free to queue the next batch.
+
+    Args:
+        window: Time to wait for further requests after the first (seconds)
+        max_batch_size: Maximum number of structures per batch
+    """
+
+    def __init__(self, window: float, max_batch_size: int = 32):
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, atoms, properties: List[str]) -> Dict[str, Any]:
+        """Queue a structure and wait for its results.
 
+        Args:
+            atoms: ASE Atoms object
+            properties: List of properties to calculate
 
-def load_backend(backend_name: str, **config) -> CalculatorBackend:
-    """Load a calculator backend.
+        Returns:
+            Results dictionary, as returned by CalculatorBackend.calculate()
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((atoms, tuple(properties), future))
+        return await future
+
+    async def _run(self) -> None:
+        """Collect queued requests into batches and evaluate them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            items = [await self._queue.get()]
+            await asyncio.sleep(self.window)
+            while len(items) < self.max_batch_size and not self._queue.empty():
+                items.append(self._queue.get_nowait())
+
+            # Only structures requesting the same properties share a batch
+            groups: Dict[tuple, list] = {}
+            for item in items:
+                groups.setdefault(item[1], []).append(item)
+
+            for properties, group in groups.items():
+                atoms_list = [atoms for atoms, _, _ in group]
+                try:
+                    results = await loop.run_in_executor(
+                        None, backend.calculate_batch, atoms_list, list(properties)
+                    )
+                except Exception as e:
+                    if len(group) == 1:
+                        self._resolve(group[0][2], exception=e)
+                        continue
+                    # One bad structure must not fail the whole batch: retry
+                    # each structure on its own so errors reach only its caller
+                    logger.debug("Batch of %d failed (%s), retrying individually",
+                                 len(group), e)
+                    for atoms, _, future in group:
+                        try:
+                            result = await loop.run_in_executor(
+                                None, backend.calculate, atoms, list(properties)
+                            )
+                        except Exception as e:
+                            self._resolve(future, exception=e)
+                        else:
+                            self._resolve(future, result=result)
+                    continue
+
+                if len(results) != len(group):
+                    error = RuntimeError(
+                        f"Backend returned {len(results)} results for a batch "
+                        f"of {len(group)} structures"
+                    )
+                    for _, _, future in group:
+                        self._resolve(future, exception=error)
+                    continue
+                for (_, _, future), result in zip(group, results):
+                    self._resolve(future, result=result)
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, result: Any = None,
+                 exception: Optional[BaseException] = None) -> None:
+        """Set a future's result or exception unless its caller has gone."""
+        if future.done():
+            return
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+
+def binary_response(results: Dict[str, Any]) -> Response:
+    """Build a binary response from packed results (see pack_binary_results).
+
+    The body holds the raw forces buffer; energy, stress and metadata are
+    sent as headers.
 
     Args:
-        backend_name: Name of backend ('petmad', 'fairchem', etc.)
-        **config: Backend-specific configuration
+        results: Results dictionary from pack_binary_results()
 
     Returns:
-        Loaded CalculatorBackend instance
+        Response with media type application/octet-stream
+    """
+    headers = {
+        "X-Energy": repr(float(results["energy"])),
+        "X-Forces-Shape": ",".join(str(n) for n in results["shape"]),
+        "X-Forces-Dtype": results["dtype"],
+        "X-Backend": backend.get_name(),
+        "X-Backend-Version": backend.get_version(),
+    }
+    if results.get("stress") is not None:
+        headers["X-Stress"] = ",".join(repr(float(s)) for s in results["stress"])
 
-    Raises:
-        ValueError: If backend_name is unknown
-        RuntimeError: If loading fails
+    return Response(
+        content=results["forces_bytes"],
+        media_type="application/octet-stream",
+        headers=headers,
+    )
+
+
+def orjson_response(results: Dict[str, Any]) -> Response:
+    """Build a JSON response for /calculate directly from NumPy results.
+
+    orjson serializes the forces and stress arrays itself, skipping the
+    conversion to nested Python lists and the pydantic serialization pass.
+    Requires orjson (pip install gulp-mlips[orjson]).
+
+    Args:
+        results: Results dictionary from CalculatorBackend.calculate()
+
+    Returns:
+        Response with media type application/json, matching CalculationResponse
     """
-    backend_map = {
-        'petmad': PETMADBackend,
-        'fairchem': FairChemBackend,
-        'gfnff': GFNFFBackend,
-        'xtb': GFNFFBackend,  # Alias for gfnff
-        'gulp': GULPBackend,
+    forces = results.get("forces")
+    stress = results.get("stress")
+    content = {
+        "energy": float(results["energy"]),
+        "forces": np.ascontiguousarray(forces) if forces is not None else None,
+        "stress": np.ascontiguousarray(stress) if stress is not None else None,
+        "backend": backend.get_name(),
+        "version": backend.get_version(),
     }
+    return Response(
+        content=orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY),
+        media_type="application/json",
+    )
 
-    if backend_name.lower() not in backend_map:
-        raise ValueError(
-            f"Unknown backend: {backend_name}. "
-            f"Available: {', '.join(backend_map.keys())}"
-        )
 
-    BackendClass = backend_map[backend_name.lower()]
-    backend_instance = BackendClass(**config)
-    backend_instance.load()
+def _same_species(previous, symbols) -> bool:
+    """Check whether two species lists (symbols or atomic numbers) match."""
+    if isinstance(previous, list) and isinstance(symbols, list):
+        return previous == symbols
+    if isinstance(previous, np.ndarray) and isinstance(symbols, np.ndarray):
+        return np.array_equal(previous, symbols)
+    return False
+
+
+def build_atoms(symbols, positions, cell=None, pbc=None, reuse=False):
+    """Build an ASE Atoms object from request fields.
+
+    With reuse=True, consecutive requests for the same species (e.g. the
+    steps of a GULP optimisation) update one Atoms object in place rather
+    than building a new one each time. The backend's calculator then stays
+    attached and the per-atom arrays are not reallocated. Only use this
+    when the previous Atoms object is no longer in use, i.e. not with
+    the request batcher.
+
+    Args:
+        symbols: Chemical symbols or atomic numbers
+        positions: Atomic positions in Angstroms (Nx3)
+        cell: Cell matrix in Angstroms (3x3), or None
+        pbc: Periodic boundary conditions, or None
+        reuse: Update the Atoms object of the previous reuse=True call
+            if the species match
+
+    Returns:
+        ASE Atoms object
+    """
+    from ase import Atoms
+
+    # One float64 conversion (no copy for msgpack arrays); Atoms copies
+    # the values into its own arrays
+    positions = np.asarray(positions, dtype=np.float64)
+    if cell is not None:
+        cell = np.asarray(cell, dtype=np.float64)
+
+    global _reusable_species, _reusable_atoms
+    if reuse and _reusable_atoms is not None and _same_species(_reusable_species, symbols):
+        atoms = _reusable_atoms
+        atoms.set_positions(positions)
+        atoms.set_cell(cell if cell is not None else np.zeros((3, 3)))
+    else:
+        atoms = Atoms(symbols=symbols, positions=positions)
+
+        # Set cell if provided
+        if cell is not None:
+            atoms.set_cell(cell)
+
+        if reuse:
+            _reusable_species = symbols if isinstance(symbols, list) else np.array(symbols)
+            _reusable_atoms = atoms
+
+    # If cell is provided but PBC not specified, assume periodic
+    atoms.set_pbc(pbc if pbc is not None else cell is not None)
+
+    return atoms
+
+
+async def evaluate(atoms, properties: List[str]) -> Dict[str, Any]:
+    """Run the backend on a structure, through the batcher if enabled.
+
+    Args:
+        atoms: ASE Atoms object
+        properties: List of properties to calculate
+
+    Returns:
+        Results dictionary, as returned by CalculatorBackend.calculate()
+    """
+    if batcher is not None:
+        results = await batcher.submit(atoms, properties)
+    else:
+        results = backend.calculate(atoms, properties=properties)
+
+    # Log calculation
+    logger.info(f"Calculated {atoms.get_chemical_symbols()}")
+    logger.info(f"  Energy: {results['energy']:.6f} eV")
+    if "forces" in results:
+        forces_norm = np.linalg.norm(results["forces"], axis=1)
+        logger.info(f"  Max force: {forces_norm.max():.6f} eV/Ang")
 
-    return backend_instance
+    return results
 
 
 @app.post("/calculate", response_model=CalculationResponse)
-async def calculate(request: CalculationRequest):
+async def calculate(request: CalculationRequest, http_request: Request):
     """Calculate energy and forces for given structure.
 
+    Clients sending "Accept: application/octet-stream" receive the forces
+    as a raw buffer (see binary_response) instead of JSON. JSON responses
+    are serialized with orjson when it is installed.
+
     Args:
         request: Calculation request with structure and properties
+        http_request: Raw HTTP request (used for content negotiation)
 
     Returns:
-        CalculationResponse with results
+        CalculationResponse with results, or a binary Response
 
     Raises:
         HTTPException: If calculation fails
@@ -123,26 +430,23 @@ async def calculate(request: CalculationRequest):
         raise HTTPException(status_code=500, detail="Backend not loaded")
 
     try:
-        # Convert to ASE Atoms
-        from ase import Atoms
-
-        atoms = Atoms(
-            symbols=request.structure.symbols,
-            positions=np.array(request.structure.positions),
+        atoms = build_atoms(
+            request.structure.symbols,
+            request.structure.get_positions(),
+            cell=request.structure.get_cell(),
+            pbc=request.structure.pbc,
+            # Batched requests are held until the batch runs
+            reuse=batcher is None,
         )
+        results = await evaluate(atoms, request.properties)
 
-        # Set cell and PBC if provided
-        if request.structure.cell is not None:
-            atoms.set_cell(request.structure.cell)
+        # Binary forces for clients that ask for them
+        accept = http_request.headers.get("accept", "")
+        if "application/octet-stream" in accept and "forces" in results:
+            return binary_response(pack_binary_results(results))
 
-        if request.structure.pbc is not None:
-            atoms.set_pbc(request.structure.pbc)
-        elif request.structure.cell is not None:
-            # If cell is provided but PBC not specified, assume periodic
-            atoms.set_pbc(True)
-
-        # Calculate properties
-        results = backend.calculate(atoms, properties=request.properties)
+        if orjson is not None:
+            return orjson_response(results)
 
         # Format response
         response = CalculationResponse(
@@ -153,18 +457,124 @@ async def calculate(request: CalculationRequest):
             version=backend.get_version(),
         )
 
-        # Log calculation
-        logger.info(f"Calculated {request.structure.symbols}")
-        logger.info(f"  Energy: {results['energy']:.6f} eV")
-        if "forces" in results:
-            forces_norm = np.linalg.norm(results["forces"], axis=1)
-            logger.info(f"  Max force: {forces_norm.max():.6f} eV/Ang")
-
         return response
 
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Calculation failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/calculate/msgpack")
+async def calculate_msgpack(http_request: Request):
+    """Calculate energy and forces for a msgpack-encoded request.
+
+    Takes the same fields as /calculate, but positions and cell may be
+    sent as packed NumPy arrays (see gulp_mlips.transport), and symbols
+    may be replaced by a packed array of atomic numbers ("numbers").
+    Forces and stress are returned as packed arrays.
+
+    Args:
+        http_request: Raw HTTP request with an application/x-msgpack body
+
+    Returns:
+        Response with media type application/x-msgpack
+
+    Raises:
+        HTTPException: If msgpack is unavailable, the request is malformed,
+            or the calculation fails
+    """
+    if not transport.MSGPACK_AVAILABLE:
+        raise HTTPException(status_code=415, detail="msgpack is not installed on the host")
+    if backend is None:
+        raise HTTPException(status_code=500, detail="Backend not loaded")
+
+    try:
+        request = transport.unpackb(await http_request.body())
+        structure = request["structure"]
+        properties = request.get("properties", ["energy", "forces"])
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid msgpack request: {e}")
+
+    try:
+        # Clients send atomic numbers as a packed array; symbols also work
+        species = structure["numbers"] if "numbers" in structure else structure["symbols"]
+        atoms = build_atoms(
+            species,
+            structure["positions"],
+            cell=structure.get("cell"),
+            pbc=structure.get("pbc"),
+            # Batched requests are held until the batch runs
+            reuse=batcher is None,
+        )
+        results = await evaluate(atoms, properties)
+
+        content = transport.packb({
+            "energy": float(results["energy"]),
+            "forces": results.get("forces"),
+            "stress": results.get("stress"),
+            "backend": backend.get_name(),
+            "version": backend.get_version(),
+        })
+        return Response(content=content, media_type=transport.MSGPACK_MEDIA_TYPE)
+
+    except Exception as e:
+        logger.exception("msgpack calculation failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/calculate_batch", response_model=BatchCalculationResponse)
+async def calculate_batch(request: BatchCalculationRequest):
+    """Calculate energy and forces for several structures in one request.
+
+    The structures are passed together to CalculatorBackend.calculate_batch(),
+    so backends with batched inference evaluate them in one model call.
+    Requests are limited to max_request_structures structures
+    (--max-request-structures) to bound memory use.
+
+    Args:
+        request: Batch request with structures and properties
+
+    Returns:
+        BatchCalculationResponse with one result per structure
+
+    Raises:
+        HTTPException: If the request is too large or calculation fails
+    """
+    if backend is None:
+        raise HTTPException(status_code=500, detail="Backend not loaded")
+
+    if len(request.structures) > max_request_structures:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many structures ({len(request.structures)}), "
+                   f"limit is {max_request_structures}",
+        )
+
+    try:
+        atoms_list = [
+            build_atoms(s.symbols, s.get_positions(), cell=s.get_cell(), pbc=s.pbc)
+            for s in request.structures
+        ]
+
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(
+            None, backend.calculate_batch, atoms_list, request.properties
+        )
+        logger.info(f"Calculated batch of {len(atoms_list)} structures")
+
+        return BatchCalculationResponse(results=[
+            CalculationResponse(
+                energy=result["energy"],
+                forces=result.get("forces").tolist() if "forces" in result else None,
+                stress=result.get("stress").tolist() if result.get("stress") is not None else None,
+                backend=backend.get_name(),
+                version=backend.get_version(),
+            )
+            for result in results
+        ])
+
+    except Exception as e:
+        logger.exception("Batch calculation failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -180,6 +590,7 @@ async def health():
         backend_loaded=backend is not None,
         backend_name=backend.get_name() if backend else None,
         backend_version=backend.get_version() if backend else None,
+        backend_properties=sorted(backend.get_implemented_properties()) if backend else None,
     )
 
 
@@ -206,6 +617,9 @@ Examples:
   # FairChem UMA for molecules
   gulp-mlips-host --backend fairchem --model uma-m-1p1 --task omol --device cuda
 
+  # FairChem UMA with compiled model and TF32 on GPU
+  gulp-mlips-host --backend fairchem --device cuda --inference-settings turbo
+
   # GFN-FF force field (very fast, good for organic molecules)
   gulp-mlips-host --backend gfnff
 
@@ -214,13 +628,16 @@ Examples:
 
   # GULP with its own force fields
   gulp-mlips-host --backend gulp --keywords "gradient" --library lib.lib
+
+  # Listen on a Unix domain socket (local clients only, no TCP overhead)
+  gulp-mlips-host --backend petmad --uds /tmp/gulp-mlips.sock
         """
     )
 
     parser.add_argument(
         '--backend',
         default='petmad',
-        choices=['petmad', 'fairchem', 'gfnff', 'xtb', 'gulp'],
+        choices=list(BACKENDS),
         help='Calculator backend to use (default: petmad)'
     )
     parser.add_argument(
@@ -236,6 +653,18 @@ Examples:
         '--task',
         help='Task name (for FairChem: omat, omol, oc20, odac, omc)'
     )
+    parser.add_argument(
+        '--inference-settings',
+        choices=['default', 'turbo', 'batch', 'traineval'],
+        help='FairChem inference preset (default: default; "turbo" adds TF32, '
+             '"batch" suits mixed compositions with --batch-window)'
+    )
+    parser.add_argument(
+        '--matmul-precision',
+        choices=['highest', 'high', 'medium'],
+        help='Float32 matmul precision on CUDA for PET-MAD (default: high, '
+             'TF32); use "highest" for full float32'
+    )
     parser.add_argument(
         '--method',
         help='Method (for xTB/GFN-FF: GFN-FF, GFN2-xTB, GFN1-xTB)'
@@ -265,6 +694,31 @@ Examples:
         default='127.0.0.1',
         help='Host to bind to (default: 127.0.0.1)'
     )
+    parser.add_argument(
+        '--uds',
+        help='Listen on this Unix domain socket instead of TCP '
+             '(use with gulp-mlips-client --uds)'
+    )
+    parser.add_argument(
+        '--batch-window',
+        type=float,
+        default=0.0,
+        help='Batch requests arriving within this many milliseconds '
+             'into one backend call (default: 0, disabled)'
+    )
+    parser.add_argument(
+        '--max-batch-size',
+        type=int,
+        default=32,
+        help='Maximum structures per batch with --batch-window (default: 32)'
+    )
+    parser.add_argument(
+        '--max-request-structures',
+        type=int,
+        default=64,
+        help='Maximum structures per /calculate_batch request, to bound '
+             'memory use (default: 64)'
+    )
 
     args = parser.parse_args()
 
@@ -281,12 +735,16 @@ Examples:
     if args.backend == 'petmad':
         config['device'] = args.device
         config['version'] = args.version
+        if args.matmul_precision:
+            config['matmul_precision'] = args.matmul_precision
     elif args.backend == 'fairchem':
         config['device'] = args.device
         if args.model:
             config['model'] = args.model
         if args.task:
             config['task'] = args.task
+        if args.inference_settings:
+            config['inference_settings'] = args.inference_settings
     elif args.backend in ['gfnff', 'xtb']:
         # xTB doesn't use GPU, always CPU
         if args.method:
@@ -310,16 +768,41 @@ Examples:
         logger.error(f"Failed to load backend: {e}")
         sys.exit(1)
 
+    global max_request_structures
+    max_request_structures = args.max_request_structures
+
+    # Enable request batching
+    global batcher
+    if args.batch_window > 0:
+        batcher = MicroBatcher(args.batch_window / 1000.0, args.max_batch_size)
+        logger.info(
+            f"Batching requests: window {args.batch_window} ms, "
+            f"max batch size {args.max_batch_size}"
+        )
+
     # Start server
-    logger.info(f"Starting server on {args.host}:{args.port}")
+    logger.info(f"Starting server on {args.uds or f'{args.host}:{args.port}'}")
     logger.info(f"Backend: {backend.get_name()} {backend.get_version()}")
     logger.info(f"Device: {args.device}")
     logger.info("Press Ctrl+C to stop")
 
+    # uvloop and httptools (pip install gulp-mlips[host]) replace the
+    # pure-Python event loop and HTTP parser when installed
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    logger.info(f"Event loop: {loop}, HTTP parser: {http}")
+
+    # Only needed to serve; importing the app (e.g. under another ASGI
+    # server) does not load it
+    import uvicorn
+
     uvicorn.run(
         app,
         host=args.host,
         port=args.port,
+        uds=args.uds,
+        loop=loop,
+        http=http,
         log_level="info"
     )
 
@@ -117,6 +117,119 @@ def init_fairchem(
         return False
 
 
+def _cached_hf_file(
+    repo_id: str,
+    filename: str,
+    revision: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+) -> Optional[str]:
+    """Look up a Hugging Face Hub file in the local cache, without downloading.
+
+    Args:
+        repo_id: Repository ID (e.g. "facebook/UMA")
+        filename: File path within the repository
+        revision: Branch, tag or commit (None = main)
+        cache_dir: Cache directory (None = Hugging Face default)
+
+    Returns:
+        Path of the cached file, or None if it is not cached
+    """
+    from huggingface_hub import try_to_load_from_cache
+
+    path = try_to_load_from_cache(repo_id, filename, cache_dir=cache_dir, revision=revision)
+    # try_to_load_from_cache returns a sentinel for known-missing files
+    return path if isinstance(path, str) else None
+
+
+def check_petmad(version: str = "latest") -> bool:
+    """Check whether the PET-MAD checkpoint is cached, without loading it.
+
+    Args:
+        version: Model version
+
+    Returns:
+        True if the checkpoint is in the local cache
+    """
+    try:
+        from pet_mad import utils as pet_mad_utils
+        from gulp_mlips.backends.petmad import PETMADBackend
+    except ImportError as e:
+        logger.error(f"\n✗ Error: {e}")
+        logger.info("\nInstall PET-MAD with: uv pip install 'gulp-mlips[petmad]'")
+        return False
+
+    # The checkpoint URL and its pattern are pet-mad internals
+    try:
+        url = PETMADBackend(version=version).checkpoint_url()
+        if url is None:
+            raise ValueError("this pet-mad version does not expose the checkpoint URL")
+        match = pet_mad_utils.hf_pattern.match(url)
+        if match is None:
+            raise ValueError(f"not a Hugging Face Hub URL: {url}")
+        path = _cached_hf_file(
+            match.group("repo_id"),
+            match.group("filename"),
+            revision=match.group("revision"),
+        )
+    except (ImportError, AttributeError, KeyError, ValueError) as e:
+        logger.error(f"\n✗ Cannot check the PET-MAD {version} cache: {e}")
+        return False
+
+    if path is None:
+        logger.error(f"\n✗ PET-MAD {version} is not cached")
+        logger.info("Run without --check to download and initialize it.")
+        return False
+
+    logger.info(f"\n✓ PET-MAD {version} is cached: {path}")
+    return True
+
+
+def check_fairchem(model: str = "uma-s-1p1") -> bool:
+    """Check whether a FairChem UMA checkpoint is cached, without loading it.
+
+    Args:
+        model: Model name
+
+    Returns:
+        True if the checkpoint is in the local cache
+    """
+    try:
+        from fairchem.core.calculate import pretrained_mlip
+    except ImportError as e:
+        logger.error(f"\n✗ Error: {e}")
+        logger.info("\nInstall FairChem with: uv pip install 'gulp-mlips[fairchem]'")
+        return False
+
+    # The checkpoint table and cache directory are fairchem internals with
+    # no public equivalent that avoids downloading (pretrained_mlip only has
+    # pretrained_checkpoint_path_from_name); pyproject pins fairchem-core 2.x
+    try:
+        checkpoint = pretrained_mlip._MODEL_CKPTS.checkpoints[model]
+        filename = checkpoint.filename
+        if checkpoint.subfolder:
+            filename = f"{checkpoint.subfolder}/{filename}"
+        path = _cached_hf_file(
+            checkpoint.repo_id,
+            filename,
+            revision=checkpoint.revision,
+            cache_dir=pretrained_mlip.CACHE_DIR,
+        )
+    except KeyError:
+        logger.error(f"\n✗ Unknown FairChem model: {model}")
+        return False
+    except (ImportError, AttributeError) as e:
+        logger.error(f"\n✗ Cannot check the FairChem {model} cache with this fairchem version: {e}")
+        return False
+
+    if path is None:
+        logger.error(f"\n✗ FairChem {model} is not cached")
+        logger.info("Run without --check to download and initialize it.")
+        return False
+
+    logger.info(f"\n✓ FairChem {model} is cached: {path}")
+    return True
+
+
 def list_available_models() -> None:
     """List all available models for all backends."""
     logger.info("\n" + "=" * 80)
@@ -159,6 +272,9 @@ Examples:
   # List available models
   gulp-mlips-init --list
 
+  # Check that a model is already cached, without loading it
+  gulp-mlips-init --backend fairchem --model uma-s-1p1 --check
+
 Note:
   FairChem models require HuggingFace authentication.
   Run 'huggingface-cli login' before initializing.
@@ -196,6 +312,11 @@ Note:
         action='store_true',
         help='List available models'
     )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Only check that the model is cached; do not download or load it'
+    )
 
     args = parser.parse_args()
 
@@ -211,6 +332,13 @@ Note:
         parser.print_help()
         sys.exit(1)
 
+    if args.check:
+        if args.backend == 'petmad':
+            cached = check_petmad(version=args.version)
+        else:
+            cached = check_fairchem(model=args.model)
+        sys.exit(0 if cached else 1)
+
     logger.info("\ngulp-mlips Model Initialization")
     logger.info("This will download and cache the model for future use.")
 
@@ -0,0 +1,72 @@
+"""Binary msgpack encoding for host/client messages.
+
+NumPy arrays are packed as raw buffers (dtype, shape and bytes) instead of
+nested lists of floats, so positions and forces cross the wire without a
+float -> text -> float round trip and are decoded with np.frombuffer.
+
+msgpack is an optional dependency (pip install gulp-mlips[msgpack]);
+check MSGPACK_AVAILABLE before using packb/unpackb.
+"""
+
+from typing import Any
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+
+
+def _encode(obj: Any) -> Any:
+    """Convert NumPy objects into msgpack-serializable values."""
+    import numpy as np
+
+    if isinstance(obj, np.ndarray):
+        data = np.ascontiguousarray(obj)
+        return {
+            "__ndarray__": True,
+            "dtype": data.dtype.str,
+            "shape": list(data.shape),
+            "data": memoryview(data.reshape(-1).view(np.uint8)),
+        }
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Cannot serialize object of type {type(obj).__name__}")
+
+
+def _decode(obj: dict) -> Any:
+    """Rebuild NumPy arrays packed by _encode()."""
+    if obj.get("__ndarray__"):
+        import numpy as np
+
+        return np.frombuffer(obj["data"], dtype=obj["dtype"]).reshape(obj["shape"])
+    return obj
+
+
+def packb(obj: Any) -> bytes:
+    """Serialize an object (which may contain NumPy arrays) to msgpack.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        msgpack-encoded bytes
+    """
+    return msgpack.packb(obj, default=_encode, use_bin_type=True)
+
+
+def unpackb(data: bytes) -> Any:
+    """Deserialize msgpack bytes produced by packb().
+
+    Arrays are returned as read-only views of the message buffer.
+
+    Args:
+        data: msgpack-encoded bytes
+
+    Returns:
+        Deserialized object
+    """
+    return msgpack.unpackb(data, object_hook=_decode, raw=False)